@@ -4,34 +4,74 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, OrderedDict, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Any, OrderedDict, Union
 
 if TYPE_CHECKING:
     from logging import Logger
 
     from nautobot.dcim.models import Device
+    from nornir.core.task import Task
     from requests import Session
 
-from nornir.core.task import Result, Task
+from nornir.core.task import Result
 from nornir_nautobot.plugins.tasks.dispatcher.default import DispatcherMixin
 
 from netscaler_ext.utils.base_connection import ConnectionMixin
 from netscaler_ext.utils.helper import (
+    build_endpoint_url,
     format_base_url_with_endpoint,
+    get_config_context,
     render_jinja_template,
     resolve_jmespath,
-    resolve_query,
 )
 
 
+# Pure on the config context key, the same few features are parsed for every device.
+@lru_cache(maxsize=256)
+def _parse_feature_name(feature_name: str) -> str:
+    """Strip the suffix off a config context feature key, i.e. "ntp_backup" -> "ntp".
+
+    Args:
+        feature_name (str): The feature name from config context.
+
+    Returns:
+        str: Parsed feature name.
+    """
+    if "_" in feature_name:
+        feat = feature_name.rsplit(sep="_", maxsplit=1)[0]
+    elif "-" in feature_name:
+        feat = feature_name.rsplit(sep="-", maxsplit=1)[0]
+    else:
+        feat = feature_name.rsplit(sep=" ", maxsplit=1)[0]
+    return feat.lower().strip().replace("-", "_").replace(" ", "_")
+
+
+@dataclass
+class ApiConnection:
+    """Connection to a REST API, returned by authenticate and passed to every call of the task.
+
+    Attrs:
+        url (str): Base URL of the API.
+        session (Session): Requests session the calls are sent over.
+        headers (dict[str, str]): Auth headers, bound to the session before the first call.
+    """
+
+    url: str
+    session: Session
+    headers: dict[str, str] = field(default_factory=dict)
+
+
 class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
     """API Base Dispatcher class."""
 
-    get_headers: dict[str, str] = {}
     post_headers: dict[str, str] = {}
-    url: str = ""
-    session: Optional[Session] = None
     controller_type: str = ""
+    # Upper bound of concurrent API calls a single task makes to the controller.
+    max_workers: int = 8
 
     @classmethod
     def _render_uri_template(
@@ -52,6 +92,17 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         """
         return render_jinja_template(obj=obj, logger=logger, template=template)
 
+    @classmethod
+    def _bind_session_headers(cls, authenticated_obj: Any) -> None:
+        """Set the authenticated headers on the session, calls then send headers=None.
+
+        Args:
+            authenticated_obj (Any): Controller object returned by authenticate.
+        """
+        if isinstance(authenticated_obj, ApiConnection):
+            # Set once per device instead of merging them into every request.
+            authenticated_obj.session.headers.update(authenticated_obj.headers)
+
     @classmethod
     def _cc_feature_name_parser(cls, feature_name: str) -> str:
         """Feature name parser.
@@ -62,13 +113,7 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         Returns:
             str: Parsed feature name.
         """
-        if "_" in feature_name:
-            feat = feature_name.rsplit(sep="_", maxsplit=1)[0]
-        elif "-" in feature_name:
-            feat = feature_name.rsplit(sep="-", maxsplit=1)[0]
-        else:
-            feat = feature_name.rsplit(sep=" ", maxsplit=1)[0]
-        return feat.lower().strip().replace("-", "_").replace(" ", "_")
+        return _parse_feature_name(feature_name=feature_name)
 
     @classmethod
     @abstractmethod
@@ -81,7 +126,7 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
             task (Task): Nornir Task object.
 
         Returns:
-            Any: Controller object or None.
+            Any: Controller object, i.e. the ApiConnection of REST controllers.
         """
 
     @classmethod
@@ -105,6 +150,40 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         # Overwrite if needed in child class
         return {}
 
+    @classmethod
+    def fetch_backup_endpoint(
+        cls,
+        connection: ApiConnection,
+        endpoint: dict[Any, Any],
+        api_endpoint: str,
+        logger: Logger,
+    ) -> Any:
+        """Fetch the API response for a single backup endpoint.
+
+        Endpoints with "conditional" set in the config context are sent as
+        conditional GETs, an unchanged payload then comes back as a bodiless
+        304 on the following backups.
+
+        Args:
+            connection (ApiConnection): Connection returned by authenticate.
+            endpoint (dict[Any, Any]): Endpoint config context.
+            api_endpoint (str): Fully built endpoint URL.
+            logger (Logger): Logger object.
+
+        Returns:
+            Any: API Response or None.
+        """
+        # Overwrite if needed in child class, i.e. to follow pagination
+        return cls.return_response_content(
+            session=connection.session,
+            method=endpoint["method"],
+            url=api_endpoint,
+            headers=None,
+            verify=False,
+            logger=logger,
+            conditional=bool(endpoint.get("conditional", False)),
+        )
+
     @classmethod
     def resolve_backup_endpoint(
         cls,
@@ -118,7 +197,7 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         """Resolve endpoint with parameters if any.
 
         Args:
-            authenticated_obj (Any): Controller object or None.
+            authenticated_obj (Any): Controller object, the ApiConnection returned by authenticate.
             device_obj (Device): Nautobot Device object.
             logger (Logger): Logger object.
             endpoint_context (list[dict[Any, Any]]): controller endpoint context.
@@ -131,30 +210,48 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         Raises:
             TypeError: If the type of responses is inconsistent (list vs dict).
         """
-        responses: dict[str, dict[Any, Any]] | list[Any] | None = None
+        if not endpoint_context:
+            logger.error(
+                f"No valid responses found for the {feature_name} endpoints",
+            )
+            return {}
+        endpoint_calls: list[tuple[dict[Any, Any], str, str]] = []
+        fetches: dict[str, tuple[dict[Any, Any], str]] = {}
         for endpoint in endpoint_context:
             uri: str = cls._render_uri_template(
                 obj=device_obj,
                 logger=logger,
                 template=endpoint["endpoint"],
             )
-            api_endpoint: str = format_base_url_with_endpoint(
-                base_url=cls.url,
+            api_endpoint: str = build_endpoint_url(
+                base_url=authenticated_obj.url,
                 endpoint=uri,
+                query=endpoint.get("query"),
+            )
+            # Endpoints that only differ by their jmespath read the same payload, fetch it once.
+            fetch_key: str = json.dumps(
+                obj=[api_endpoint, {k: v for k, v in endpoint.items() if k != "jmespath"}],
+                sort_keys=True,
+                default=str,
             )
-            if endpoint.get("query"):
-                api_endpoint = resolve_query(
+            fetches.setdefault(fetch_key, (endpoint, api_endpoint))
+            endpoint_calls.append((endpoint, api_endpoint, fetch_key))
+        # The GETs are independent, send them together over the pooled session.
+        with ThreadPoolExecutor(max_workers=max(1, min(cls.max_workers, len(fetches)))) as executor:
+            futures: dict[str, Future[Any]] = {
+                fetch_key: executor.submit(
+                    cls.fetch_backup_endpoint,
+                    connection=authenticated_obj,
+                    endpoint=endpoint,
                     api_endpoint=api_endpoint,
-                    query=endpoint["query"],
+                    logger=logger,
                 )
-            response: Any = cls.return_response_content(
-                session=cls.session,
-                method=endpoint["method"],
-                url=api_endpoint,
-                headers=cls.get_headers,
-                verify=False,
-                logger=logger,
-            )
+                for fetch_key, (endpoint, api_endpoint) in fetches.items()
+            }
+        parts: list[dict[Any, Any] | list[Any]] = []
+        # Merge in endpoint order so list responses extend deterministically.
+        for endpoint, api_endpoint, fetch_key in endpoint_calls:
+            response: Any = futures[fetch_key].result()
             if response is None:
                 logger.error(
                     f"Error in API call to {api_endpoint}: No response",
@@ -168,25 +265,22 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
             if not jpath_fields or (isinstance(jpath_fields, dict) and all(v is None for v in jpath_fields.values())):
                 logger.error(f"jmespath values not found in {response}")
                 continue
-            if isinstance(jpath_fields, list):
-                if responses is None:
-                    responses = jpath_fields
-                    continue
-                if not isinstance(responses, list):
-                    exc_msg: str = f"All responses should be list but got {type(responses)}"
-                    raise TypeError(exc_msg)
-                responses.extend(jpath_fields)
-            elif isinstance(jpath_fields, dict):
-                if responses is None:
-                    responses = jpath_fields
-                if not isinstance(responses, dict):
-                    exc_msg: str = f"All responses should be dict but got {type(responses)}"
-                    raise TypeError(exc_msg)
-                responses.update(jpath_fields)
-            else:
+            if not isinstance(jpath_fields, (list, dict)):
                 logger.error(
                     f"Unexpected jmespath response type: {type(jpath_fields)}",
                 )
+                continue
+            # The first response decides whether the feature is a list or a dict.
+            if parts and isinstance(jpath_fields, list) is not isinstance(parts[0], list):
+                exc_msg: str = f"All responses should be {type(parts[0]).__name__} but got {type(jpath_fields)}"
+                raise TypeError(exc_msg)
+            parts.append(jpath_fields)
+        # Merge once at the end, this also leaves the fetched payloads untouched.
+        responses: dict[str, dict[Any, Any]] | list[Any] = {}
+        if parts and isinstance(parts[0], list):
+            responses = list(chain.from_iterable(parts))
+        elif parts:
+            responses = {key: value for part in parts for key, value in part.items()}
 
         if responses:
             return responses
@@ -222,12 +316,13 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         Raises:
             ValueError: If controller endpoints cannot be found in the config context.
         """
-        cfg_cntx: OrderedDict[Any, Any] = obj.get_config_context()
+        cfg_cntx: OrderedDict[Any, Any] = get_config_context(obj=obj)
         authenticated_obj: Any = cls.authenticate(
             logger=logger,
             obj=obj,
             task=task,
         )
+        cls._bind_session_headers(authenticated_obj=authenticated_obj)
         logger.info(
             f"Authenticated to {obj.name} platform: {obj.platform.name}",
         )
@@ -299,7 +394,7 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
         """Resolve endpoint with parameters if any.
 
         Args:
-            authenticated_obj (Any): Controller object, i.e. Meraki Dashboard object or None.
+            authenticated_obj (Any): Controller object, the ApiConnection returned by authenticate.
             device_obj (Device): Nautobot Device object.
             logger (Logger): Logger object.
             endpoint_context (list[dict[Any, Any]]): controller endpoint config context.
@@ -310,7 +405,8 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
             list[dict[str, Any]]: List of API responses.
         """
         aggregated_results: list[Any] = []
-        if not cls.session:
+        calls: list[tuple[dict[Any, Any], str, list[dict[Any, Any]]]] = []
+        if not isinstance(authenticated_obj, ApiConnection):
             logger.error("No session available for API calls")
             return aggregated_results
         for endpoint in endpoint_context:
@@ -320,7 +416,7 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
                 template=endpoint["endpoint"],
             )
             api_endpoint: str = format_base_url_with_endpoint(
-                base_url=cls.url,
+                base_url=authenticated_obj.url,
                 endpoint=uri,
             )
             req_params: list[str] = (
@@ -328,27 +424,44 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
                 if "parameters" in endpoint and "non_optional" in endpoint["parameters"]
                 else []
             )
+            # Resolve the required parameters once per endpoint, then merge them into each body.
+            extra_params: dict[str, Any] = {}
+            for param in req_params if kwargs else []:
+                if not kwargs.get(param):
+                    logger.error(
+                        "resolve_endpoint method needs '%s' in kwargs",
+                        param,
+                    )
+                else:
+                    extra_params[param] = kwargs[param]
             if isinstance(payload, dict):
-                payload_copy = payload.copy()
-                for param in req_params:
-                    if not kwargs:
-                        continue
-                    if not kwargs.get(param):
-                        logger.error(
-                            "resolve_endpoint method needs '%s' in kwargs",
-                            param,
-                        )
-                    elif kwargs.get(param):
-                        payload_copy.update({param: kwargs[param]})
-                response: Any = cls.return_response_content(
-                    session=cls.session,
-                    method=endpoint["method"],
-                    url=api_endpoint,
-                    headers=cls.get_headers,
-                    verify=False,
-                    logger=logger,
-                    body=payload_copy,
-                )
+                bodies: list[dict[Any, Any]] = [{**payload, **extra_params}]
+            elif isinstance(payload, list):
+                bodies = [{**item, **extra_params} for item in payload if isinstance(item, dict)]
+            else:
+                bodies = []
+            calls.append((endpoint, api_endpoint, bodies))
+        for endpoint, api_endpoint, bodies in calls:
+            request_kwargs: dict[str, Any] = {
+                "session": authenticated_obj.session,
+                "method": endpoint["method"],
+                "url": api_endpoint,
+                "headers": None,
+                "verify": False,
+                "logger": logger,
+            }
+            # Writes go out one at a time and in order, unless the endpoint declares its items independent.
+            if endpoint.get("parallel") and len(bodies) > 1:
+                with ThreadPoolExecutor(max_workers=min(cls.max_workers, len(bodies))) as executor:
+                    futures: list[Future[Any]] = [
+                        executor.submit(cls.return_response_content, body=body, **request_kwargs)
+                        for body in bodies
+                    ]
+                # Collect in submission order so results line up with the payload order.
+                responses: list[Any] = [future.result() for future in futures]
+            else:
+                responses = [cls.return_response_content(body=body, **request_kwargs) for body in bodies]
+            for response in responses:
                 if not response:
                     logger.error(
                         "Error in API call to %s: No response",
@@ -356,37 +469,6 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
                     )
                     continue
                 aggregated_results.append(response)
-            elif isinstance(payload, list):
-                for item in payload:
-                    if not isinstance(item, dict):
-                        continue
-                    item_copy = item.copy()
-                    for param in req_params:
-                        if not kwargs:
-                            continue
-                        if not kwargs.get(param):
-                            logger.error(
-                                "resolve_endpoint method needs '%s' in kwargs",
-                                param,
-                            )
-                        else:
-                            item_copy.update({param: kwargs[param]})
-                    response: Any = cls.return_response_content(
-                        session=cls.session,
-                        method=endpoint["method"],
-                        url=api_endpoint,
-                        headers=cls.get_headers,
-                        verify=False,
-                        logger=logger,
-                        body=item_copy,
-                    )
-                    if not response:
-                        logger.error(
-                            "Error in API call to %s: No response",
-                            api_endpoint,
-                        )
-                        continue
-                    aggregated_results.append(response)
         return aggregated_results
 
     @classmethod
@@ -419,13 +501,14 @@ class ApiBaseDispatcher(DispatcherMixin, ConnectionMixin, ABC):
             "Config merge via controller dispatcher starting",
             extra={"object": obj},
         )
-        cfg_cntx: OrderedDict[Any, Any] = obj.get_config_context()
+        cfg_cntx: OrderedDict[Any, Any] = get_config_context(obj=obj)
         # The above Python code snippet is performing the following actions:
         authenticated_obj: Any = cls.authenticate(
             logger=logger,
             obj=obj,
             task=task,
         )
+        cls._bind_session_headers(authenticated_obj=authenticated_obj)
         controller_dict: dict[str, str] = cls.controller_setup(
             device_obj=obj,
             authenticated_obj=authenticated_obj,
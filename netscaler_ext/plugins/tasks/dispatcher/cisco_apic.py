@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import (
     ApiBaseDispatcher,
+    ApiConnection,
 )
 from netscaler_ext.utils.helper import (
     format_base_url_with_endpoint,
@@ -26,9 +27,11 @@ class NetmikoCiscoApic(ApiBaseDispatcher):
     """APIC Controller Dispatcher class."""
 
     controller_type: str = "apic"
+    # APIC expects JSON bodies sent as text/plain, shared by every request.
+    text_headers: dict[str, str] = {"Content-Type": "text/plain"}
 
     @classmethod
-    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> Any:
+    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> ApiConnection:
         """Authenticate to controller.
 
         Args:
@@ -40,9 +43,9 @@ class NetmikoCiscoApic(ApiBaseDispatcher):
             ValueError: Could not find the controller API URL in config context.
 
         Returns:
-            Any: Controller object or None.
+            ApiConnection: Connection to the APIC controller.
         """
-        cls.url: str = resolve_controller_url(
+        url: str = resolve_controller_url(
             obj=obj,
             controller_type=cls.controller_type,
             logger=logger,
@@ -54,18 +57,16 @@ class NetmikoCiscoApic(ApiBaseDispatcher):
             },
         }
         auth_url: str = format_base_url_with_endpoint(
-            base_url=cls.url,
+            base_url=url,
             endpoint="api/aaaLogin.json",
         )
         # TODO: Change verify to true
-        cls.session: Session = cls.configure_session()
+        session: Session = cls.configure_session(base_url=url)
         auth_resp: Any = cls.return_response_content(
-            session=cls.session,
+            session=session,
             method="POST",
             url=auth_url,
-            headers={
-                "Content-Type": "text/plain",
-            },
+            headers=cls.text_headers,
             logger=logger,
             body=json.dumps(auth_payload),
             verify=False,
@@ -83,7 +84,8 @@ class NetmikoCiscoApic(ApiBaseDispatcher):
             exc_msg: str = "Could not find cookie from APIC controller"
             logger.error(exc_msg)
             raise ValueError(exc_msg)
-        cls.get_headers = {
-            "Cookie": f"APIC-cookie={cookie}",
-            "Content-Type": "text/plain",
-        }
+        return ApiConnection(
+            url=url,
+            session=session,
+            headers={**cls.text_headers, "Cookie": f"APIC-cookie={cookie}"},
+        )
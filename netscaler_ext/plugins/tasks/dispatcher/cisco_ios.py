@@ -4,70 +4,74 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 if TYPE_CHECKING:
     from logging import Logger
 
     from nautobot.dcim.models import Device
+    from nornir.core.task import Task
 
-import textfsm
-from nornir.core.task import Result, Task
+from nornir.core.task import Result
 from nornir_nautobot.plugins.tasks.dispatcher.default import NetmikoDefault
 
+from netscaler_ext.utils.helper import parse_textfsm
 
-def snmp_user_template(snmp_user_output: str) -> list[dict[str, str]]:
+_SNMP_USER_TEMPLATE_PATH: Path = Path(__file__).parent.joinpath(
+    "textfsm_templates/cisco_ios_show_snmp_user.textfsm",
+)
+
+# Splits the key length off the privacy protocol, i.e. "aes128" -> "aes 128".
+_PRIV_KEY_LENGTH_RE: re.Pattern[str] = re.compile(pattern=r"([A-Za-z]+)(\d+)")
+
+
+def snmp_user_template(snmp_user_output: str) -> Iterator[dict[str, str]]:
     """SNMP user textfsm template.
 
     Args:
         snmp_user_output (str): SNMP user command output.
 
     Returns:
-        list[dict[str, str]]: List of parsed SNMP users.
+        Iterator[dict[str, str]]: Parsed SNMP users, built lazily per row.
     """
-    file_path: Path = Path(__file__).parent
-
-    template_path: Path = file_path.joinpath(
-        "textfsm_templates/cisco_ios_show_snmp_user.textfsm",
+    header, parsed_results = parse_textfsm(
+        template_path=_SNMP_USER_TEMPLATE_PATH,
+        text=snmp_user_output,
     )
-    with open(file=template_path, encoding="utf-8") as template_file:
-        fsm = textfsm.TextFSM(template=template_file)
-        parsed_results: list[str] = fsm.ParseText(text=snmp_user_output)
+    return (dict(zip(header, row)) for row in parsed_results)
+
 
-    parsed_users: list[dict[str, str]] = []
-    for row in parsed_results:
-        parsed_users.append(dict(zip(fsm.header, row)))
-    return parsed_users
+def _snmp_user_command(snmp_user: dict[str, str]) -> str:
+    """Build the snmp-server user command for a single parsed SNMP user.
+
+    Args:
+        snmp_user (dict[str, str]): Parsed SNMP user.
+
+    Returns:
+        str: SNMP user command.
+    """
+    auth: str = snmp_user["AUTH"].lower()
+    priv: str = _PRIV_KEY_LENGTH_RE.sub(repl=r"\1 \2", string=snmp_user["PRIV"].lower())
+    acl: str = snmp_user["ACL_FILTER"]
+    auth_cmd: str = f" auth {auth} <<<SNMP_USER_AUTH_KEY>>>" if auth else ""
+    priv_cmd: str = f" priv {priv} <<<SNMP_USER_PRIV_KEY>>>" if priv else ""
+    acl_cmd: str = f" access {acl}" if acl else ""
+    return f"snmp-server user {snmp_user['USERNAME']} {snmp_user['GROUP']} v3{auth_cmd}{priv_cmd}{acl_cmd}"
 
 
-def snmp_user_command_build(parsed_snmp_user: list[dict[str, str]]) -> str:
+def snmp_user_command_build(parsed_snmp_user: Iterable[dict[str, str]]) -> str:
     """Builds a list of SNMP user commands.
 
     Args:
-        parsed_snmp_user (list[dict[str, str]]): List of parsed SNMP users.
+        parsed_snmp_user (Iterable[dict[str, str]]): Parsed SNMP users.
 
     Returns:
         str: SNMP user commands.
     """
-    snmp_user_commands: list[str] = []
-    if not parsed_snmp_user:
+    snmp_user_commands: str = "\n".join(map(_snmp_user_command, parsed_snmp_user))
+    if not snmp_user_commands:
         return ""
-    snmp_user_commands.append("! show snmp user")
-    for snmp_user in parsed_snmp_user:
-        single_user: str = f"snmp-server user {snmp_user['USERNAME']} {snmp_user['GROUP']} v3"
-        if snmp_user["AUTH"]:
-            auth: str = snmp_user["AUTH"].lower()
-            single_user += f" auth {auth} <<<SNMP_USER_AUTH_KEY>>>"
-        if snmp_user["PRIV"]:
-            priv: str = snmp_user["PRIV"].lower()
-            priv_processed = re.sub(pattern=r"([a-zA-Z]+)(\d+)", repl=r"\1 \2", string=priv)
-            single_user += f" priv {priv_processed} <<<SNMP_USER_PRIV_KEY>>>"
-        if snmp_user["ACL_FILTER"]:
-            acl: str = snmp_user["ACL_FILTER"]
-            single_user += f" access {acl}"
-        snmp_user_commands.append(single_user)
-
-    return "\n".join(snmp_user_commands)
+    return f"! show snmp user\n{snmp_user_commands}"
 
 
 class NetmikoCiscoIos(NetmikoDefault):
@@ -100,23 +104,22 @@ class NetmikoCiscoIos(NetmikoDefault):
                 running configuration.
         """
         logger.debug(f"Executing get_config for {task.host.name} on {task.host.platform}")
-        full_config: str = ""
+        config_parts: list[str] = []
         for command in cls.config_commands:
             getter_result: Result = cls.get_command(task=task, logger=logger, obj=obj, command=command)
+            command_output: str = getter_result.result.get("output", {}).get(command, "")
             if "show snmp user" in command:
-                snmp_user_result: list[dict[str, str]] = snmp_user_template(
-                    snmp_user_output=getter_result.result.get("output").get(
-                        command,
-                    ),
+                snmp_user_result: Iterator[dict[str, str]] = snmp_user_template(
+                    snmp_user_output=command_output,
                 )
-                full_config += snmp_user_command_build(
-                    parsed_snmp_user=snmp_user_result,
+                config_parts.append(
+                    snmp_user_command_build(parsed_snmp_user=snmp_user_result),
                 )
                 continue
-            full_config += getter_result.result.get("output").get(command)
+            config_parts.append(command_output)
         processed_config: str = cls._process_config(
             logger=logger,
-            running_config=full_config,
+            running_config="".join(config_parts),
             remove_lines=remove_lines,
             substitute_lines=substitute_lines,
             backup_file=backup_file,
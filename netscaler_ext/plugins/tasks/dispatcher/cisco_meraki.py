@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, OrderedDict
 
 if TYPE_CHECKING:
@@ -17,12 +22,53 @@ from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import (
 )
 from netscaler_ext.utils.helper import (
     add_api_path_to_url,
+    get_config_context,
     resolve_controller_url,
     resolve_jmespath,
     resolve_params,
 )
 
 
+# Endpoints flagged "bulk" return org or network wide data that is the same for every
+# device. Their calls are shared for a few minutes, keyed by dashboard URL, organization
+# ID, network ID, method and payload, the future resolves to the response.
+_BULK_CACHE_TTL: float = 300.0
+_BULK_CACHE: dict[tuple[str, str, str, str, str], tuple[float, Future[Any]]] = {}
+_BULK_CACHE_LOCK: threading.Lock = threading.Lock()
+# Resolved 'class.method' callables, kept on the dashboard client that owns them.
+_METHOD_CACHE_ATTR: str = "_netscaler_ext_method_cache"
+# Retries the SDK makes on a rate limited (429) or failed call before raising.
+_MAXIMUM_RETRIES: int = 4
+
+
+@lru_cache(maxsize=16)
+def _dashboard_api(base_url: str, api_key: str) -> DashboardAPI:
+    """Build the Meraki dashboard client once per controller URL and API key.
+
+    Every device behind the same dashboard reuses the client, and with it the
+    SDK's requests session and its warm keep-alive connections.
+
+    Args:
+        base_url (str): Meraki dashboard API URL.
+        api_key (str): Meraki dashboard API key.
+
+    Returns:
+        DashboardAPI: Meraki dashboard client.
+    """
+    return DashboardAPI(
+        api_key=api_key,
+        base_url=base_url,
+        output_log=False,
+        print_console=False,
+        # Let the SDK sleep for the Retry-After of a 429, shared by the worker threads,
+        # instead of bursting past the dashboard's rate limit.
+        wait_on_rate_limit=True,
+        maximum_retries=_MAXIMUM_RETRIES,
+        retry_4xx_error=False,
+        suppress_logging=True,
+    )
+
+
 # Resolving endpoint private functions
 def _resolve_method_callable(
     controller_obj: Any,
@@ -39,6 +85,10 @@ def _resolve_method_callable(
     Returns:
         Callable[[Any], Any] | None: Method callable or None.
     """
+    method_cache: dict[str, Callable[[Any], Any]] = vars(controller_obj).setdefault(_METHOD_CACHE_ATTR, {})
+    cached: Callable[[Any], Any] | None = method_cache.get(method)
+    if cached is not None:
+        return cached
     cotroller_class, controller_method = method.split(sep=".")
     try:
         class_callable: Callable[[Any], Any] = getattr(
@@ -58,6 +108,7 @@ def _resolve_method_callable(
         exc_msg: str = f"The method {controller_method} does not exist in the {cotroller_class} class"
         logger.error(exc_msg)
         return None
+    method_cache[method] = method_callable
     return method_callable
 
 
@@ -80,45 +131,112 @@ def _send_call(
         return None
 
 
+def _send_bulk_call(
+    base_url: str,
+    organization_id: str,
+    network_id: str,
+    method: str,
+    method_callable: Callable[[Any], Any],
+    logger: Logger,
+    payload: dict[Any, Any],
+) -> Any | None:
+    """Send an org or network wide call once and share its response with every device asking for it.
+
+    The first caller of a key sends the call, the devices asking for the same
+    key meanwhile wait for its response instead of sending their own. A
+    response is shared for five minutes, a failed call is not kept so the next
+    caller sends it again.
+
+    Args:
+        base_url (str): Meraki dashboard URL.
+        organization_id (str): Meraki organization ID of the device.
+        network_id (str): Meraki network ID of the device.
+        method (str): 'class.method' name.
+        method_callable (Callable[[Any], Any]): Method to call.
+        logger (Logger): Logger object.
+        payload (dict[Any, Any]): Payload to pass to the API call.
+
+    Returns:
+        Any | None: API response or None.
+    """
+    cache_key: tuple[str, str, str, str, str] = (
+        base_url,
+        str(organization_id),
+        str(network_id or ""),
+        method,
+        json.dumps(payload, sort_keys=True, default=str),
+    )
+    now: float = time.monotonic()
+    with _BULK_CACHE_LOCK:
+        cached: tuple[float, Future[Any]] | None = _BULK_CACHE.get(cache_key)
+        sender: bool = not cached or now - cached[0] >= _BULK_CACHE_TTL
+        if sender:
+            for expired in [key for key, (stamp, _) in _BULK_CACHE.items() if now - stamp >= _BULK_CACHE_TTL]:
+                del _BULK_CACHE[expired]
+            future: Future[Any] = Future()
+            _BULK_CACHE[cache_key] = (now, future)
+        else:
+            future = cached[1]
+    if not sender:
+        return future.result()
+    response: Any | None = None
+    try:
+        response = _send_call(
+            method_callable=method_callable,
+            logger=logger,
+            payload=payload,
+        )
+    finally:
+        if not response:
+            with _BULK_CACHE_LOCK:
+                if _BULK_CACHE.get(cache_key, (0.0, None))[1] is future:
+                    del _BULK_CACHE[cache_key]
+        # Always resolved, the devices waiting on it must not hang on a failed call.
+        future.set_result(response)
+    return response
+
+
 def _send_remediation_call(
     api_context: dict[str, Any],
     method_callable: Callable[[Any], Any],
-    aggregated_results: list[Any],
     logger: Logger,
     payload: dict[Any, Any],
     **kwargs: Any,
-) -> None:
+) -> Any | None:
     """Send remediation call.
 
     Args:
         api_context (dict[str, Any]): API endpoint context.
         method_callable (Callable[[Any], Any]): Method to call
-        aggregated_results (list[Any]): List of aggregated results.
         logger (Logger): Logger object.
         payload (dict[Any, Any]): Payload to pass to the API call.
         kwargs (Any): Keyword arguments.
+
+    Returns:
+        Any | None: API response or None.
     """
-    for param in api_context["parameters"]["non_optional"]:
+    extra_params: dict[str, Any] = {}
+    for param in api_context.get("parameters", {}).get("non_optional", []):
         if not kwargs.get(param):
             logger.error(
                 f"resolve_endpoint method needs '{param}' in kwargs",
             )
-        payload.update({param: kwargs[param]})
-    response: Any | None = _send_call(
+            continue
+        extra_params[param] = kwargs[param]
+    # Merge into a new dict, the same payload can be sent to several endpoints concurrently.
+    return _send_call(
         method_callable=method_callable,
         logger=logger,
-        payload=payload,
+        payload={**payload, **extra_params},
     )
-    if not response:
-        return
-
-    aggregated_results.append(response)
 
 
 class NetmikoCiscoMeraki(ApiBaseDispatcher):
     """Meraki Controller Dispatcher class."""
 
     controller_type = "meraki"
+    # Meraki enforces a per-organization rate limit, keep concurrent calls under it.
+    max_workers: int = 5
 
     @classmethod
     def authenticate(cls, logger: Logger, obj: Device, task: Task) -> Any:
@@ -145,11 +263,9 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
             base_url=url,
         )
         api_key: str = task.host.password
-        controller_obj: DashboardAPI = DashboardAPI(
-            api_key=api_key,
+        controller_obj: DashboardAPI = _dashboard_api(
             base_url=controller_url,
-            output_log=False,
-            print_console=False,
+            api_key=api_key,
         )
         if not controller_obj:
             exc_msg: str = "Could not authenticate to the Meraki controller"
@@ -178,7 +294,7 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
         Raises:
             ValueError: If the Meraki organization ID is not found in API response.
         """
-        config_context: OrderedDict[Any, Any] = device_obj.get_config_context()
+        config_context: OrderedDict[Any, Any] = get_config_context(obj=device_obj)
         org_id: str = config_context.get("organization_id")
         if not org_id:
             exc_msg: str = "Could not find the Meraki organization ID in API response"
@@ -225,11 +341,11 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
             missing: str = exc.args[0]
             exc_msg: str = f"resolve_endpoint() needs '{missing}' in kwargs"
             raise ValueError(exc_msg) from exc
-        responses: dict[str, dict[Any, Any]] | list[Any] | None = None
         param_mapper: dict[str, str] = {
             "organizationId": organization_id,
             "networkId": network_id,
         }
+        calls: list[tuple[dict[Any, Any], Callable[[Any], Any], dict[Any, Any]]] = []
         for endpoint in endpoint_context:
             method_callable: Callable[[Any], Any] | None = _resolve_method_callable(
                 controller_obj=authenticated_obj,
@@ -245,11 +361,50 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
                 parameters=endpoint.get("parameters"),
                 param_mapper=param_mapper,
             )
-            response: Any | None = _send_call(
-                method_callable=method_callable,
+            if endpoint.get("paginate"):
+                # The SDK walks every page itself instead of returning only the first one.
+                params["total_pages"] = "all"
+            calls.append((endpoint, method_callable, params))
+        base_url: str = ""
+        if any(endpoint.get("bulk") for endpoint, _, _ in calls):
+            base_url = resolve_controller_url(
+                obj=device_obj,
+                controller_type=cls.controller_type,
                 logger=logger,
-                payload=params,
             )
+        with ThreadPoolExecutor(max_workers=max(1, min(cls.max_workers, len(calls)))) as executor:
+            futures: list[Future[Any]] = [
+                (
+                    executor.submit(
+                        _send_bulk_call,
+                        base_url=base_url,
+                        organization_id=organization_id,
+                        network_id=network_id,
+                        method=endpoint["endpoint"],
+                        method_callable=method_callable,
+                        logger=logger,
+                        payload=params,
+                    )
+                    if endpoint.get("bulk")
+                    else executor.submit(
+                        _send_call,
+                        method_callable=method_callable,
+                        logger=logger,
+                        payload=params,
+                    )
+                )
+                for endpoint, method_callable, params in calls
+            ]
+        responses: dict[str, dict[Any, Any]] | list[Any] | None = None
+        is_list: bool = False
+        for (endpoint, _, _), future in zip(calls, futures):
+            response: Any | None = future.result()
+            bulk_key: str | None = endpoint.get("bulk_key")
+            if bulk_key and isinstance(response, list):
+                # Keep this device's share of an org or network wide response, i.e. by serial.
+                response = [
+                    item for item in response if isinstance(item, dict) and item.get(bulk_key) == kwargs.get(bulk_key)
+                ]
             if not response:
                 logger.warning(
                     msg=f"The API call to {endpoint['endpoint']} returned no response",
@@ -263,21 +418,17 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
             if not jpath_fields:
                 logger.error(f"jmespath values not found in {response}")
                 continue
-            if isinstance(jpath_fields, list):
-                if responses is None:
-                    responses = jpath_fields
-                    continue
-                if not isinstance(responses, list):
-                    exc_msg: str = f"All responses should be list but got {type(responses)}"
-                    raise TypeError(exc_msg)
+            if responses is None:
+                # The first response decides whether the feature is a list or a dict.
+                responses = jpath_fields
+                is_list = isinstance(responses, list)
+                continue
+            if isinstance(jpath_fields, list) is not is_list:
+                exc_msg: str = f"All responses should be {type(responses).__name__} but got {type(jpath_fields)}"
+                raise TypeError(exc_msg)
+            if is_list:
                 responses.extend(jpath_fields)
             else:
-                if responses is None:
-                    responses = jpath_fields
-                    continue
-                if not isinstance(responses, dict):
-                    exc_msg: str = f"All responses should be dict but got {type(responses)}"
-                    raise TypeError(exc_msg)
                 responses.update(jpath_fields)
 
         if responses:
@@ -311,6 +462,7 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
             list[dict[str, Any]]: List of API responses.
         """
         aggregated_results: list[Any] = []
+        calls: list[tuple[dict[str, Any], Callable[[Any], Any], list[dict[Any, Any]]]] = []
         for api_context in endpoint_context:
             method_callable: Callable[[Any], Any] | None = _resolve_method_callable(
                 controller_obj=authenticated_obj,
@@ -323,22 +475,36 @@ class NetmikoCiscoMeraki(ApiBaseDispatcher):
                 )
                 continue
             if isinstance(payload, dict):
-                _send_remediation_call(
-                    api_context=api_context,
-                    method_callable=method_callable,
-                    aggregated_results=aggregated_results,
-                    logger=logger,
-                    payload=payload,
-                    **kwargs,
-                )
+                calls.append((api_context, method_callable, [payload]))
             if isinstance(payload, list):
-                for item in payload:
+                calls.append((api_context, method_callable, payload))
+        for api_context, method_callable, items in calls:
+            # Writes go out one at a time and in order, unless the endpoint declares its items independent.
+            if api_context.get("parallel") and len(items) > 1:
+                with ThreadPoolExecutor(max_workers=min(cls.max_workers, len(items))) as executor:
+                    futures: list[Future[Any]] = [
+                        executor.submit(
+                            _send_remediation_call,
+                            api_context=api_context,
+                            method_callable=method_callable,
+                            logger=logger,
+                            payload=item,
+                            **kwargs,
+                        )
+                        for item in items
+                    ]
+                # Collect in submission order so results line up with the payload order.
+                responses: list[Any] = [future.result() for future in futures]
+            else:
+                responses = [
                     _send_remediation_call(
                         api_context=api_context,
                         method_callable=method_callable,
-                        aggregated_results=aggregated_results,
                         logger=logger,
                         payload=item,
                         **kwargs,
                     )
+                    for item in items
+                ]
+            aggregated_results.extend(response for response in responses if response)
         return aggregated_results
@@ -2,79 +2,83 @@
 
 from __future__ import annotations
 
+import re
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 if TYPE_CHECKING:
     from logging import Logger
 
     from nautobot.dcim.models import Device
+    from nornir.core.task import Task
 
-import textfsm
-from nornir.core.task import Result, Task
+from nornir.core.task import Result
 from nornir_nautobot.plugins.tasks.dispatcher.default import NetmikoDefault
 
+from netscaler_ext.utils.helper import parse_textfsm
 
-def snmp_user_template(snmp_user_output: str) -> list[dict[str, str]]:
+_SNMP_USER_TEMPLATE_PATH: Path = Path(__file__).parent.joinpath(
+    "textfsm_templates/cisco_nxos_show_snmp_user.textfsm",
+)
+
+# NXOS suffixes the protocol with "(no)" when it is not enforced, i.e. "aes-128(no)".
+_NO_SUFFIX_RE: re.Pattern[str] = re.compile(pattern=r"\(no\)")
+
+
+def snmp_user_template(snmp_user_output: str) -> Iterator[dict[str, str]]:
     """SNMP user textfsm template.
 
     Args:
         snmp_user_output (str): SNMP user command output.
 
     Returns:
-        list[dict[str, str]]: List of parsed SNMP users.
+        Iterator[dict[str, str]]: Parsed SNMP users, built lazily per row.
     """
-    file_path: Path = Path(__file__).parent
-
-    template_path: Path = file_path.joinpath(
-        "textfsm_templates/cisco_nxos_show_snmp_user.textfsm",
+    header, parsed_results = parse_textfsm(
+        template_path=_SNMP_USER_TEMPLATE_PATH,
+        text=snmp_user_output,
     )
-    with open(file=template_path, encoding="utf-8") as template_file:
-        fsm = textfsm.TextFSM(template=template_file)
-        parsed_results: list[str] = fsm.ParseText(text=snmp_user_output)
+    return (dict(zip(header, row)) for row in parsed_results)
+
+
+def _snmp_user_commands(snmp_user: dict[str, str]) -> Iterator[str]:
+    """Yield the snmp-server user commands for a single parsed SNMP user.
 
-    parsed_users: list[dict[str, str]] = []
-    for row in parsed_results:
-        parsed_users.append(dict(zip(fsm.header, row)))
-    return parsed_users
+    Args:
+        snmp_user (dict[str, str]): Parsed SNMP user.
+
+    Yields:
+        str: SNMP user command, plus the ACL command if the user has one.
+    """
+    username: str = snmp_user["USERNAME"]
+    auth: str = snmp_user["AUTH"]
+    priv: str = snmp_user["PRIV"]
+    acl: str = snmp_user["ACL_FILTER"]
+    auth_cmd: str = (
+        f" auth {_NO_SUFFIX_RE.sub(repl='', string=auth)} <<<SNMP_USER_AUTH_KEY>>>" if auth and auth != "no" else ""
+    )
+    priv_cmd: str = (
+        f" priv {_NO_SUFFIX_RE.sub(repl='', string=priv)} <<<SNMP_USER_PRIV_KEY>>>" if priv and priv != "no" else ""
+    )
+    yield f"snmp-server user {username} {snmp_user['GROUP']}{auth_cmd}{priv_cmd} localizedkey"
+    if acl:
+        yield f"snmp-server user {username} use-ipv4 acl {acl.replace('ipv4:', '')}"
 
 
-def snmp_user_command_build(parsed_snmp_user: list[dict[str, str]]) -> str:
+def snmp_user_command_build(parsed_snmp_user: Iterable[dict[str, str]]) -> str:
     """Builds a list of SNMP user commands.
 
     Args:
-        parsed_snmp_user (list[dict[str, str]]): List of parsed SNMP users.
+        parsed_snmp_user (Iterable[dict[str, str]]): Parsed SNMP users.
 
     Returns:
         str: SNMP user commands.
     """
-    snmp_user_commands: list[str] = []
-    if not parsed_snmp_user:
+    snmp_user_commands: str = "\n".join(chain.from_iterable(map(_snmp_user_commands, parsed_snmp_user)))
+    if not snmp_user_commands:
         return ""
-    snmp_user_commands.append("! show snmp user")
-    for snmp_user in parsed_snmp_user:
-        single_user: str = f"snmp-server user {snmp_user['USERNAME']} {snmp_user['GROUP']}"
-        if snmp_user["AUTH"] and snmp_user["AUTH"] != "no":
-            if "(no)" in snmp_user["AUTH"]:
-                auth = snmp_user["AUTH"].replace("(no)", "")
-            else:
-                auth: str = snmp_user["AUTH"]
-            single_user += f" auth {auth} <<<SNMP_USER_AUTH_KEY>>>"
-        if snmp_user["PRIV"] and snmp_user["PRIV"] != "no":
-            if "(no)" in snmp_user["PRIV"]:
-                priv = snmp_user["PRIV"].replace("(no)", "")
-            else:
-                priv: str = snmp_user["PRIV"]
-            single_user += f" priv {priv} <<<SNMP_USER_PRIV_KEY>>>"
-        single_user += " localizedkey"
-        snmp_user_commands.append(single_user)
-        if snmp_user["ACL_FILTER"]:
-            acl: str = snmp_user["ACL_FILTER"].replace("ipv4:", "")
-            snmp_user_commands.append(
-                f"snmp-server user {snmp_user['USERNAME']} use-ipv4 acl {acl}",
-            )
-
-    return "\n".join(snmp_user_commands)
+    return f"! show snmp user\n{snmp_user_commands}"
 
 
 class NetmikoCiscoNxos(NetmikoDefault):
@@ -107,23 +111,22 @@ class NetmikoCiscoNxos(NetmikoDefault):
                 running configuration.
         """
         logger.debug(f"Executing get_config for {task.host.name} on {task.host.platform}")
-        full_config: str = ""
+        config_parts: list[str] = []
         for command in cls.config_commands:
             getter_result = cls.get_command(task=task, logger=logger, obj=obj, command=command)
+            command_output: str = getter_result.result.get("output", {}).get(command, "")
             if "show snmp user" in command:
-                snmp_user_result: list[dict[str, str]] = snmp_user_template(
-                    snmp_user_output=getter_result.result.get("output").get(
-                        command,
-                    ),
+                snmp_user_result: Iterator[dict[str, str]] = snmp_user_template(
+                    snmp_user_output=command_output,
                 )
-                full_config += snmp_user_command_build(
-                    parsed_snmp_user=snmp_user_result,
+                config_parts.append(
+                    snmp_user_command_build(parsed_snmp_user=snmp_user_result),
                 )
                 continue
-            full_config += getter_result.result.get("output").get(command)
+            config_parts.append(command_output)
         processed_config: str = cls._process_config(
             logger=logger,
-            running_config=full_config,
+            running_config="".join(config_parts),
             remove_lines=remove_lines,
             substitute_lines=substitute_lines,
             backup_file=backup_file,
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
@@ -9,24 +13,66 @@ if TYPE_CHECKING:
 
     from nautobot.dcim.models import Device
     from nornir.core.task import Task
-    from requests import Response, Session
+    from requests import Response
 
 from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import (
     ApiBaseDispatcher,
+    ApiConnection,
 )
 from netscaler_ext.utils.helper import (
     format_base_url_with_endpoint,
     resolve_controller_url,
 )
 
+# Auth headers are reused until they age out, kept below vManage's 30 minute
+# session timeout, or until the controller answers with a 401.
+_AUTH_CACHE_TTL: float = 1500.0
+_AUTH_CACHE: dict[tuple[str, str, str], tuple[float, dict[str, str]]] = {}
+# Held across the lookup and the login, hosts behind the same controller wait for one login.
+_AUTH_CACHE_LOCK: threading.Lock = threading.Lock()
+# A call answered 401 is only sent again after the new login when sending it twice is harmless.
+_RESEND_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+# Records per page for backup endpoints with "paginate" enabled in the config context.
+_DEFAULT_PAGE_SIZE: int = 500
+
+
+def _auth_cache_key(url: str, username: str, password: str) -> tuple[str, str, str]:
+    """Build the auth cache key, a changed password must not reuse the old login.
+
+    Args:
+        url (str): Controller URL.
+        username (str): vManage username.
+        password (str): vManage password.
+
+    Returns:
+        tuple[str, str, str]: URL, username and a digest of the password.
+    """
+    return url, username, hashlib.sha256((password or "").encode()).hexdigest()
+
+
+@dataclass
+class _VmanageConnection(ApiConnection):
+    """vManage connection, keeping the credentials to log in again when the cookie is rejected.
+
+    Attrs:
+        username (str): vManage username.
+        password (str): vManage password.
+    """
+
+    username: str = ""
+    password: str = field(default="", repr=False)
+
 
 class NetmikoCiscoVmanage(ApiBaseDispatcher):
     """Vmanage Controller Dispatcher class."""
 
     controller_type: str = "vmanage"
+    # Static headers, shared by every request, requests does not mutate them.
+    form_headers: dict[str, str] = {"Content-Type": "application/x-www-form-urlencoded"}
+    json_headers: dict[str, str] = {"Content-Type": "application/json"}
 
     @classmethod
-    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> Any:
+    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> ApiConnection:
         """Authenticate to controller.
 
         Args:
@@ -38,59 +84,220 @@ class NetmikoCiscoVmanage(ApiBaseDispatcher):
             ValueError: Could not find the controller API URL in config context.
 
         Returns:
-            Any: Controller object or None.
+            ApiConnection: Connection to the vManage controller.
         """
-        cls.url: str = resolve_controller_url(
+        url: str = resolve_controller_url(
             obj=obj,
             controller_type=cls.controller_type,
             logger=logger,
         )
-        username, password = task.host.username, task.host.password
-        j_security_payload = f"j_username={username}&j_password={password}"
+        # TODO: Change verify to true
+        connection: _VmanageConnection = _VmanageConnection(
+            url=url,
+            session=cls.configure_session(base_url=url),
+            username=task.host.username,
+            password=task.host.password,
+        )
+        connection.headers = cls._auth_headers(logger=logger, connection=connection)
+        return connection
+
+    @classmethod
+    def _auth_headers(
+        cls,
+        logger: Logger,
+        connection: _VmanageConnection,
+        rejected: Optional[dict[str, str]] = None,
+    ) -> dict[str, str]:
+        """Return the cached auth headers of the connection's credentials, logging in when there are none.
+
+        Args:
+            logger (Logger): Logger object.
+            connection (_VmanageConnection): Connection to log in with.
+            rejected (dict[str, str] | None): Headers the controller answered a 401 to, never reused.
+
+        Raises:
+            ValueError: Could not generate the vManage cookie or XSRF token.
+
+        Returns:
+            dict[str, str]: Headers carrying the session cookie and XSRF token.
+        """
+        cache_key: tuple[str, str, str] = _auth_cache_key(
+            url=connection.url,
+            username=connection.username,
+            password=connection.password,
+        )
+        with _AUTH_CACHE_LOCK:
+            cached: Optional[tuple[float, dict[str, str]]] = _AUTH_CACHE.get(cache_key)
+            # Another worker may have logged in again since the rejected headers were issued.
+            if cached and cached[1] is not rejected and time.monotonic() - cached[0] < _AUTH_CACHE_TTL:
+                logger.info("Reusing cached vManage cookie.")
+                return cached[1]
+            # Dropped before logging in, a failed login must not leave them cached.
+            _AUTH_CACHE.pop(cache_key, None)
+            headers: dict[str, str] = cls._login(logger=logger, connection=connection)
+            now: float = time.monotonic()
+            for expired in [key for key, (stamp, _) in _AUTH_CACHE.items() if now - stamp >= _AUTH_CACHE_TTL]:
+                del _AUTH_CACHE[expired]
+            _AUTH_CACHE[cache_key] = (now, headers)
+        return headers
+
+    @classmethod
+    def _login(cls, logger: Logger, connection: _VmanageConnection) -> dict[str, str]:
+        """Log in to vManage and build the headers for the following API calls.
+
+        Args:
+            logger (Logger): Logger object.
+            connection (_VmanageConnection): Connection to log in with.
+
+        Raises:
+            ValueError: Could not generate the vManage cookie or XSRF token.
+
+        Returns:
+            dict[str, str]: Headers carrying the session cookie and XSRF token.
+        """
+        j_security_payload = f"j_username={connection.username}&j_password={connection.password}"
         security_url: str = format_base_url_with_endpoint(
-            base_url=cls.url,
+            base_url=connection.url,
             endpoint="j_security_check",
         )
-        # TODO: Change verify to true
-        cls.session: Session = cls.configure_session()
         security_resp: Optional[Response] = cls.return_response_obj(
-            session=cls.session,
+            session=connection.session,
             method="POST",
             url=security_url,
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
+            headers=cls.form_headers,
             logger=logger,
             body=j_security_payload,
             verify=False,
         )
-        if not security_resp or not security_resp.headers.get("Set-Cookie"):
+        j_session_id: str = security_resp.headers.get("Set-Cookie", "") if security_resp else ""
+        if not j_session_id:
             exc_msg: str = "Could not generate vManage cookie. Please check the credentials and try again."
             logger.error(exc_msg)
             raise ValueError(exc_msg)
         logger.info("Successfully generated vManage cookie.")
-        j_session_id: str = security_resp.headers.get("Set-Cookie", "")
         token_url: str = format_base_url_with_endpoint(
-            base_url=cls.url,
+            base_url=connection.url,
             endpoint="dataservice/client/token",
         )
-        token_resp: Any = cls.return_response_content(
-            session=cls.session,
+        token_resp: Optional[Response] = cls.return_response_obj(
+            session=connection.session,
             method="GET",
             url=token_url,
-            headers={
-                "Cookie": j_session_id,
-                "Content-Type": "application/json",
-            },
+            headers={**cls.json_headers, "Cookie": j_session_id},
             verify=False,
             logger=logger,
         )
-        if not token_resp:
+        # The token endpoint returns the bare token as plain text, not JSON.
+        xsrf_token: str = token_resp.text.strip() if token_resp else ""
+        if not xsrf_token:
             exc_msg: str = "Could not generate vManage XSRF token."
             logger.error(exc_msg)
             raise ValueError(exc_msg)
-        cls.get_headers = {
-            "Cookie": j_session_id,
-            "Content-Type": "application/json",
-            "X-XSRF-TOKEN": str(token_resp),
-        }
+        return {**cls.json_headers, "Cookie": j_session_id, "X-XSRF-TOKEN": xsrf_token}
+
+    @classmethod
+    def _fetch(cls, connection: _VmanageConnection, method: str, url: str, logger: Logger) -> Any:
+        """Send a request, logging in again when vManage answers 401.
+
+        Only GET, HEAD and OPTIONS calls are sent once more with the new
+        cookie, any other method fails and is left to the caller to repeat.
+
+        Args:
+            connection (_VmanageConnection): Connection returned by authenticate.
+            method (str): HTTP Method to use.
+            url (str): URL to send request to.
+            logger (Logger): Logger object.
+
+        Returns:
+            Any: API Response or None.
+        """
+        response: Optional[Response] = cls._send_request(
+            method=method,
+            url=url,
+            headers=None,
+            session=connection.session,
+            logger=logger,
+            verify=False,
+        )
+        if response is not None and response.status_code == 401:
+            logger.warning("vManage rejected the cached cookie, logging in again.")
+            try:
+                headers: dict[str, str] = cls._auth_headers(
+                    logger=logger,
+                    connection=connection,
+                    rejected=connection.headers,
+                )
+            except ValueError:
+                return None
+            connection.headers = headers
+            connection.session.headers.update(headers)
+            if method.upper() not in _RESEND_METHODS:
+                logger.error(f"{method} {url} was rejected with a 401 and is not sent again.")
+                return None
+            response = cls._send_request(
+                method=method,
+                url=url,
+                headers=None,
+                session=connection.session,
+                logger=logger,
+                verify=False,
+            )
+        if response is None:
+            return None
+        if not response.ok:
+            logger.error(
+                f"Endpoint {url} returned {response.status_code}: {response.text}",
+            )
+            return None
+        return cls._parse_response_content(response=response)
+
+    @classmethod
+    def fetch_backup_endpoint(
+        cls,
+        connection: ApiConnection,
+        endpoint: dict[Any, Any],
+        api_endpoint: str,
+        logger: Logger,
+    ) -> Any:
+        """Fetch a backup endpoint, following vManage pagination when enabled.
+
+        Endpoints with "paginate" set in the config context are requested in
+        pages of that many records (500 if it is just true), passing the
+        previous page's pageInfo.endId as startId until vManage stops
+        reporting moreEntries. The pages' data lists are merged into a single
+        response so the jmespath values apply as for an unpaginated call.
+
+        Args:
+            connection (ApiConnection): Connection returned by authenticate.
+            endpoint (dict[Any, Any]): Endpoint config context.
+            api_endpoint (str): Fully built endpoint URL.
+            logger (Logger): Logger object.
+
+        Returns:
+            Any: API Response or None.
+        """
+        paginate: bool | int = endpoint.get("paginate", False)
+        if not paginate:
+            return cls._fetch(connection=connection, method=endpoint["method"], url=api_endpoint, logger=logger)
+        page_size: int = _DEFAULT_PAGE_SIZE if paginate is True else int(paginate)
+        separator: str = "&" if "?" in api_endpoint else "?"
+        page_url: str = f"{api_endpoint}{separator}count={page_size}"
+        response: Any = None
+        data: list[Any] = []
+        start_id: Any = None
+        while True:
+            page: Any = cls._fetch(connection=connection, method=endpoint["method"], url=page_url, logger=logger)
+            if not isinstance(page, dict):
+                # Keep what was collected so far, a failed first page is a failed call.
+                break
+            response = page
+            data.extend(page.get("data", []))
+            page_info: dict[str, Any] = page.get("pageInfo") or {}
+            end_id: Any = page_info.get("endId")
+            if not page_info.get("moreEntries") or end_id is None or end_id == start_id:
+                break
+            start_id = end_id
+            page_url = f"{api_endpoint}{separator}count={page_size}&startId={start_id}"
+        if response is None:
+            return None
+        return {**response, "data": data}
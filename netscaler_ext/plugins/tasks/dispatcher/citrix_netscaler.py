@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from logging import Logger
 
     from nautobot.dcim.models import Device
     from nornir.core.task import Task
-    from requests import Session
 
 from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import (
     ApiBaseDispatcher,
+    ApiConnection,
 )
 
 
+# Pure on the device name, so cache it for the size of a fleet.
+@lru_cache(maxsize=4096)
 def use_snip_hostname(hostname: str) -> str:
     """Use the SNIP hostname format for Citrix Netscaler.
 
@@ -35,7 +38,7 @@ class NetmikoCitrixNetscaler(ApiBaseDispatcher):
     """Netscaler Controller Dispatcher class."""
 
     @classmethod
-    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> Any:
+    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> ApiConnection:
         """Authenticate to controller.
 
         Args:
@@ -44,15 +47,18 @@ class NetmikoCitrixNetscaler(ApiBaseDispatcher):
             task (Task): Nornir Task object.
 
         Returns:
-            Any: Controller object or None.
+            ApiConnection: Connection to the Netscaler's API.
         """
         hostname: str = use_snip_hostname(hostname=obj.name)
-        cls.url: str = f"https://{hostname}"
-        cls.session: Session = cls.configure_session()
+        url: str = f"https://{hostname}"
         username: str = task.host.username
         password: str = task.host.password
-        cls.get_headers = {
-            "X-NITRO-USER": username,
-            "X-NITRO-PASS": password,
-            "Content-Type": "application/json",
-        }
+        return ApiConnection(
+            url=url,
+            session=cls.configure_session(base_url=url),
+            headers={
+                "X-NITRO-USER": username,
+                "X-NITRO-PASS": password,
+                "Content-Type": "application/json",
+            },
+        )
@@ -3,20 +3,18 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, Optional, Union
-
-import requests
-from requests import exceptions as req_exceptions
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from logging import Logger
 
     from nautobot.dcim.models import Device
     from nornir.core.task import Task
-    from requests import Session
+    from requests import Response, Session
 
 from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import (
     ApiBaseDispatcher,
+    ApiConnection,
 )
 from netscaler_ext.utils.helper import (
     base_64_encode_credentials,
@@ -27,7 +25,7 @@ class NetmikoWti(ApiBaseDispatcher):
     """APIC Controller Dispatcher class."""
 
     @classmethod
-    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> Any:
+    def authenticate(cls, logger: Logger, obj: Device, task: Task) -> ApiConnection:
         """Authenticate to controller.
 
         Args:
@@ -36,36 +34,40 @@ class NetmikoWti(ApiBaseDispatcher):
             task (Task): Nornir Task object.
 
         Returns:
-            Any: Controller object or None.
+            ApiConnection: Connection to the device's API.
         """
-        cls.url: str = f"https://{obj.primary_ip4.host}"
-        cls.session: Session = cls.configure_session()
+        url: str = f"https://{obj.primary_ip4.host}"
+        session: Session = cls.configure_session(base_url=url)
         encoded_creds: str = base_64_encode_credentials(
             username=task.host.username,
             password=task.host.password,
         )
-        cls.get_headers = {
-            "Authorization": encoded_creds,
-            "Content-Type": "application/json",
-        }
+        return ApiConnection(
+            url=url,
+            session=session,
+            headers={
+                "Authorization": encoded_creds,
+                "Content-Type": "application/json",
+            },
+        )
 
     @classmethod
     def _return_response(
         cls,
         method: str,
         url: str,
-        headers: dict[str, str],
-        session: requests.Session,
+        headers: Optional[dict[str, str]],
+        session: Session,
         logger: Logger,
         body: Optional[Union[dict[str, str], str]] = None,
         verify: bool = True,
-    ) -> Optional[requests.Response]:
-        """Create request for authentication and return response object.
+    ) -> Optional[Response]:
+        """Create request and return response object, sending PUT payloads as JSON.
 
         Args:
             method (str): HTTP Method to use.
             url (str): URL to send request to.
-            headers (dict): Headers to use in request.
+            headers (dict | None): Headers to use in request, on top of the session headers.
             session (Session): Session to use.
             logger (Logger): The dispatcher's logger.
             body (dict[str, str] | str | None): Body of request.
@@ -74,43 +76,16 @@ class NetmikoWti(ApiBaseDispatcher):
         Returns:
             Optional[Response]: API Response object.
         """
-        with session as ses:
-            try:
-                if method == "PUT":
-                    body = json.dumps(body)
-                response: Optional[requests.Response] = ses.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    data=body,
-                    timeout=(50.0, 100.0),
-                    verify=verify,
-                )
-            except req_exceptions.SSLError as exc_ssl:
-                exc_msg: str = f"SSL error occurred: {exc_ssl}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.Timeout as exc_timeout:
-                exc_msg: str = f"Request timed out: {exc_timeout}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.ConnectionError as exc_conn:
-                exc_msg: str = f"Connection error occurred: {exc_conn}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.RequestException as exc_req:
-                exc_msg: str = f"Request exception occurred: {exc_req}"
-                logger.error(exc_msg)
-                response = None
-            except Exception as exc:
-                exc_msg: str = f"An error occurred: {exc}"
-                logger.error(exc_msg)
-                response = None
-        if response is None:
-            return response
-        if not response.ok:
-            logger.error(
-                f"Endpoint {url} returned {response.status_code}: {response.text}",
-            )
-            return None
-        return response
+        if method == "PUT" and isinstance(body, dict):
+            # Only dict payloads need encoding, a str body is already serialised
+            # and a missing one must not be sent as "null".
+            body = json.dumps(body)
+        return super()._return_response(
+            method=method,
+            url=url,
+            headers=headers,
+            session=session,
+            logger=logger,
+            body=body,
+            verify=verify,
+        )
@@ -5,7 +5,6 @@ from __future__ import annotations
 import json
 from abc import ABC, abstractmethod
 from collections import deque
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 if TYPE_CHECKING:
@@ -13,18 +12,14 @@ if TYPE_CHECKING:
 
 from django.core.exceptions import ValidationError
 
-# pylint: disable=too-many-arguments, too-many-positional-arguments
-
-
-@dataclass(frozen=True)
-class DictKey:
-    """Dict key dataclass.
+from netscaler_ext.utils.helper import get_config_context
 
-    Attrs:
-        key (Any): The key.
-    """
+# pylint: disable=too-many-arguments, too-many-positional-arguments
 
-    key: Any
+# Tags a path step as a dict key, ("d", key), int steps are list indexes.
+_DICT_KEY: str = "d"
+# Marks a key or index missing from the actual config, its intended value goes to the diff as is.
+_MISSING: object = object()
 
 
 class BaseControllerRemediation(ABC):  # pylint: disable=too-few-public-methods
@@ -123,8 +118,8 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
             is_last = i == len(path) - 1
             next_key = path[i + 1] if not is_last else None
 
-            if isinstance(key, DictKey):
-                dict_key: Any = key.key
+            if isinstance(key, tuple) and key[0] == _DICT_KEY:
+                dict_key: Any = key[1]
                 if is_last:
                     current[dict_key] = value
                 else:
@@ -165,7 +160,7 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
         path: tuple[Any],
         stack: deque[tuple[tuple[str, ...], Any, Any]],
     ) -> None:
-        """Dictionary config.
+        """Dictionary config, queues the keys on the stack in document order.
 
         Args:
             intended (dict[Any, Any]): Intended config.
@@ -174,51 +169,15 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
             path (tuple[Any]): Path of keys.
             stack (deque[Tuple[Tuple[str, ...], Any, Any]]): Stack of tuples.
         """
-        for key, value in intended.items():
+        for key, value in reversed(intended.items()):
+            actual_value: Any = actual.get(key, _MISSING)
             if isinstance(value, dict):
-                stack.append(
-                    (
-                        path + (DictKey(key=key),),
-                        actual.get(key, {}),
-                        value,
-                    ),
-                )
-                self._dict_config(
-                    intended=value,
-                    actual=actual.get(key, {}),
-                    diff=diff,
-                    path=path + (DictKey(key=key),),
-                    stack=stack,
-                )
+                actual_value = actual_value if isinstance(actual_value, dict) else {}
             elif isinstance(value, list):
-                stack.append(
-                    (
-                        path + (DictKey(key=key),),
-                        actual.get(key, []),
-                        value,
-                    ),
-                )
-                self._list_config(
-                    intended=value,
-                    actual=actual.get(key, []),
-                    diff=diff,
-                    path=path + (DictKey(key=key),),
-                    stack=stack,
-                )
-            elif isinstance(value, (str, int, float, bool)):
-                if key not in actual:
-                    self._process_diff(
-                        diff=diff,
-                        path=path + (DictKey(key=key),),
-                        value=value,
-                    )
-                else:
-                    self._str_int_float_config(
-                        intended=value,
-                        actual=actual.get(key, ""),
-                        diff=diff,
-                        path=path + (DictKey(key=key),),
-                    )
+                actual_value = actual_value if isinstance(actual_value, list) else []
+            elif not isinstance(value, (str, int, float, bool)):
+                continue
+            stack.append((path + ((_DICT_KEY, key),), actual_value, value))
 
     def _list_config(
         self,
@@ -228,53 +187,71 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
         path: tuple[Any],
         stack: deque[tuple[tuple[str, ...], Any, Any]],
     ) -> None:
-        """List config.
+        """List config, queues the items on the stack in document order.
 
         Args:
             intended (list[Any]): Intended config.
             actual (list[Any]): Actual config.
-            required_params (list[Any]): Required parameters.
             diff (dict[Any, Any]): Diff dictionary.
             path (tuple[Any]): Path of keys.
             stack (deque[Tuple[Tuple[str, ...], Any, Any]]): Stack of tuples.
         """
-        for index, intended_item in enumerate(intended):
+        for index in reversed(range(len(intended))):
+            intended_item: Any = intended[index]
             if index >= len(actual):
+                stack.append((path + (index,), _MISSING, intended_item))
+                continue
+            actual_item: Any = actual[index]
+            if isinstance(intended_item, dict):
+                actual_item = actual_item if isinstance(actual_item, dict) else {}
+            elif isinstance(intended_item, list):
+                actual_item = actual_item if isinstance(actual_item, list) else []
+            elif not isinstance(actual_item, (str, int, float, bool)):
+                actual_item = ""
+            stack.append((path + (index,), actual_item, intended_item))
+
+    def _process_stack(
+        self,
+        diff: dict[Any, Any],
+        stack: deque[tuple[tuple[str, ...], Any, Any]],
+    ) -> None:
+        """Walk the config iteratively, containers push their children back on the stack.
+
+        Args:
+            diff (dict[Any, Any]): Diff dictionary.
+            stack (deque[Tuple[Tuple[str, ...], Any, Any]]): Stack of tuples.
+        """
+        while stack:
+            path, actual, intended = stack.pop()
+
+            if actual is _MISSING:
                 self._process_diff(
                     diff=diff,
-                    path=path + (index,),
-                    value=intended_item,
+                    path=path,
+                    value=intended,
                 )
-                continue
-            try:
-                actual_item = actual[index]
-            except IndexError:
-                actual_item = None
-
-            if isinstance(intended_item, dict):
-                stack.append((path + (index,), actual_item, intended_item))
+            elif isinstance(actual, dict) and isinstance(intended, dict):
                 self._dict_config(
-                    intended=intended_item,
-                    actual=actual_item if isinstance(actual_item, dict) else {},
+                    intended=intended,
+                    actual=actual,
                     diff=diff,
-                    path=path + (index,),
+                    path=path,
                     stack=stack,
                 )
-            elif isinstance(intended_item, list):
-                stack.append((path + (index,), actual_item, intended_item))
+            elif isinstance(actual, list) and isinstance(intended, list):
                 self._list_config(
-                    intended=intended_item,
-                    actual=actual_item if isinstance(actual_item, list) else [],
+                    intended=intended,
+                    actual=actual,
                     diff=diff,
-                    path=path + (index,),
+                    path=path,
                     stack=stack,
                 )
             else:
                 self._str_int_float_config(
-                    intended=intended_item,
-                    actual=actual_item if isinstance(actual_item, (str, int, float, bool)) else "",
+                    intended=intended,
+                    actual=actual,
                     diff=diff,
-                    path=path + (index,),
+                    path=path,
                 )
 
     def _str_int_float_config(
@@ -365,7 +342,7 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
         Returns:
             str: Remediation config.
         """
-        config_context: dict[str, Any] = self.compliance_obj.device.get_config_context()
+        config_context: dict[str, Any] = get_config_context(obj=self.compliance_obj.device)
         if config_context.get("remediate_full_intended", False):
             if isinstance(self.intended_config, str):
                 self.intended_config: dict[Any, Any] = json.loads(self.intended_config)
@@ -389,34 +366,7 @@ class JsonControllerRemediation(BaseControllerRemediation):  # pylint: disable=t
         diff: dict[str, Any] = {}
         stack: deque[tuple[tuple[str, ...], Any, Any]] = deque()
         stack.append((tuple(), actual, intended))
-
-        while stack:
-            path, actual, intended = stack.pop()
-
-            if isinstance(actual, dict) and isinstance(intended, dict):
-                self._dict_config(
-                    intended=intended,
-                    actual=actual,
-                    diff=diff,
-                    path=path,
-                    stack=stack,
-                )
-
-            elif isinstance(actual, list) and isinstance(intended, list):
-                self._list_config(
-                    intended=intended,
-                    actual=actual,
-                    diff=diff,
-                    path=path,
-                    stack=stack,
-                )
-            else:
-                self._str_int_float_config(
-                    intended=intended,
-                    actual=actual,
-                    diff=diff,
-                    path=path,
-                )
+        self._process_stack(diff=diff, stack=stack)
 
         if not diff:
             return ""
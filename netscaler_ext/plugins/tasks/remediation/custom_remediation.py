@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from netscaler_ext.plugins.tasks.remediation.controller_remediation import (
     controller_remediation,
 )
+from netscaler_ext.utils.helper import get_config_context
 
 if TYPE_CHECKING:
     from nautobot_golden_config.models import ConfigCompliance
@@ -23,7 +24,7 @@ def remediation_func(
     Returns:
         str: Remediation config.
     """
-    if obj.device.get_config_context().get("remediation_endpoints"):
+    if get_config_context(obj=obj.device).get("remediation_endpoints"):
         return controller_remediation(obj=obj)
     from nautobot_golden_config.models import _get_hierconfig_remediation
 
@@ -1,10 +1,14 @@
 """Unit tests for the Cisco APIC dispatcher."""
 
+import json
 import unittest
 from logging import Logger, getLogger
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from requests import exceptions as req_exceptions
+
+from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import ApiConnection
 from netscaler_ext.plugins.tasks.dispatcher.cisco_apic import NetmikoCiscoApic
 from netscaler_ext.tests.fixtures import get_json_fixture
 
@@ -166,16 +170,18 @@ class TestCiscoApicDispatcher(unittest.TestCase):
         mock_configure_session.assert_called_once()
         mock_return_response_content.assert_called_once()
 
-    @patch.object(target=NetmikoCiscoApic, attribute="url", new="https://apic.com")
-    @patch.object(target=NetmikoCiscoApic, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoApic, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoApic, attribute="return_response_obj")
-    def test_resolve_backup_endpoint(self, mock_return_response_obj, mock_session) -> None:
+    def test_resolve_backup_endpoint(self) -> None:
         """Test the authentication process for the Cisco APIC dispatcher."""
-        mock_session.return_value = MagicMock()
-        mock_return_response_obj.return_value.json.return_value = get_json_fixture(
-            folder="api_responses",
-            file_name="cisco_apic_backup.json",
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = MagicMock(
+            ok=True,
+            status_code=200,
+            content=json.dumps(
+                get_json_fixture(
+                    folder="api_responses",
+                    file_name="cisco_apic_backup.json",
+                ),
+            ).encode(),
         )
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
@@ -187,7 +193,7 @@ class TestCiscoApicDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoApic.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://apic.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -197,15 +203,12 @@ class TestCiscoApicDispatcher(unittest.TestCase):
 
         # Assertions
         self.assertIsNotNone(obj=responses)
+        self.assertEqual(responses["name"], "test_tenant")
 
-    @patch.object(target=NetmikoCiscoApic, attribute="url", new="https://apic.com")
-    @patch.object(target=NetmikoCiscoApic, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoApic, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoApic, attribute="return_response_obj")
-    def test_resolve_backup_endpoint_no_response(self, mock_return_response_obj, mock_session) -> None:
+    def test_resolve_backup_endpoint_no_response(self) -> None:
         """Test resolve_backup_endpoint when no response is returned."""
-        mock_session.return_value = MagicMock()
-        mock_return_response_obj.return_value = None
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.side_effect = req_exceptions.ConnectionError("APIC unreachable")
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -215,7 +218,7 @@ class TestCiscoApicDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoApic.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://apic.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -225,14 +228,10 @@ class TestCiscoApicDispatcher(unittest.TestCase):
 
         self.assertEqual(responses, {})
 
-    @patch.object(target=NetmikoCiscoApic, attribute="url", new="https://apic.com")
-    @patch.object(target=NetmikoCiscoApic, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoApic, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoApic, attribute="return_response_obj")
-    def test_resolve_backup_endpoint_jmespath_not_found(self, mock_return_response_obj, mock_session) -> None:
+    def test_resolve_backup_endpoint_jmespath_not_found(self) -> None:
         """Test resolve_backup_endpoint when jmespath values are not found."""
-        mock_session.return_value = MagicMock()
-        mock_return_response_obj.return_value.json.return_value = {"some_key": "some_value"}
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = MagicMock(ok=True, status_code=200, content=b'{"some_key": "some_value"}')
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -242,7 +241,7 @@ class TestCiscoApicDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoApic.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://apic.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
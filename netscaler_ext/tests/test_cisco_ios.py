@@ -55,3 +55,16 @@ class TestIosDispatcher(unittest.TestCase):
             )
             print(result.result)
             self.assertEqual(result.result.get("config"), snmp_config)
+
+    def test_snmp_user_template_reparse(self) -> None:
+        """Test the cached TextFSM template does not leak rows between parses."""
+        snmp_user_output: str = get_cfg_fixture(
+            folder="backup_response",
+            file_name="ios_snmp_user.cfg",
+        )
+
+        first_parse: list[dict[str, str]] = list(snmp_user_template(snmp_user_output=snmp_user_output))
+        second_parse: list[dict[str, str]] = list(snmp_user_template(snmp_user_output=snmp_user_output))
+
+        self.assertTrue(first_parse)
+        self.assertEqual(first_parse, second_parse)
@@ -1,6 +1,10 @@
 """Unit tests for the Cisco Meraki dispatcher."""
 
+import threading
+import time
 import unittest
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger, getLogger
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -16,6 +20,23 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
 
     base_import_path: str = "netscaler_ext.plugins.tasks.dispatcher"
 
+    # Org wide call whose response is filtered down to the device by serial.
+    bulk_endpoint_context: list[dict[str, Any]] = [
+        {
+            "endpoint": "organizations.getOrganizationDevices",
+            "method": "GET",
+            "query": [],
+            "parameters": ["organizationId"],
+            "bulk": True,
+            "bulk_key": "serial",
+            "jmespath": {"name": "[].name"},
+        },
+    ]
+
+    def setUp(self) -> None:
+        """Use a dashboard of its own per test, clients and bulk calls are cached by dashboard URL."""
+        self.controller_url: str = f"https://{uuid.uuid4().hex}.meraki.com"
+
     @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
     @patch(f"{base_import_path}.cisco_meraki.add_api_path_to_url")
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
@@ -27,8 +48,8 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
     ) -> None:
         """Test the authentication process for the Cisco Meraki dispatcher."""
         # Setup mocks
-        mock_resolve_url.return_value = "https://mock-controller-url"
-        mock_add_api_path.return_value = "https://mock-controller-url/api/v1"
+        mock_resolve_url.return_value = self.controller_url
+        mock_add_api_path.return_value = f"{self.controller_url}/api/v1"
         mock_dashboard_api.return_value = MagicMock()
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -46,16 +67,42 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         mock_resolve_url.assert_called_once()
         mock_add_api_path.assert_called_once_with(
             api_path="api/v1",
-            base_url="https://mock-controller-url",
+            base_url=self.controller_url,
         )
         mock_dashboard_api.assert_called_once_with(
             api_key="mock_api_key",
-            base_url="https://mock-controller-url/api/v1",
+            base_url=f"{self.controller_url}/api/v1",
             output_log=False,
             print_console=False,
+            wait_on_rate_limit=True,
+            maximum_retries=4,
+            retry_4xx_error=False,
+            suppress_logging=True,
         )
         self.assertIsNotNone(obj=controller)
 
+    @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_meraki.add_api_path_to_url")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_authenticate_reuses_dashboard_api(
+        self,
+        mock_dashboard_api,
+        mock_add_api_path,
+        mock_resolve_url,
+    ) -> None:
+        """Test devices behind the same dashboard share one DashboardAPI client."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_add_api_path.return_value = f"{self.controller_url}/api/v1"
+        logger: Logger = getLogger(name="test")
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+
+        first: DashboardAPI = NetmikoCiscoMeraki.authenticate(logger=logger, obj=MagicMock(), task=task)
+        second: DashboardAPI = NetmikoCiscoMeraki.authenticate(logger=logger, obj=MagicMock(), task=task)
+
+        mock_dashboard_api.assert_called_once()
+        self.assertIs(first, second)
+
     @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
     @patch(f"{base_import_path}.cisco_meraki.add_api_path_to_url")
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
@@ -92,7 +139,7 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         mock_resolve_url,
     ) -> None:
         """Test authentication when add_api_path_to_url raises ValueError."""
-        mock_resolve_url.return_value = "https://mock-controller-url"
+        mock_resolve_url.return_value = self.controller_url
         mock_add_api_path.side_effect = ValueError("Test Error")
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -119,8 +166,8 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         mock_resolve_url,
     ) -> None:
         """Test authentication when DashboardAPI returns None."""
-        mock_resolve_url.return_value = "https://mock-controller-url"
-        mock_add_api_path.return_value = "https://mock-controller-url/api/v1"
+        mock_resolve_url.return_value = self.controller_url
+        mock_add_api_path.return_value = f"{self.controller_url}/api/v1"
         mock_dashboard_api.return_value = None
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -163,6 +210,29 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         self.assertIsNotNone(obj=setup_dict)
         self.assertIn(member="organizationId", container=setup_dict)
 
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_controller_setup_caches_config_context(
+        self,
+        mock_dashboard_api,
+    ) -> None:
+        """Test controller_setup renders the device config context only once."""
+        mock_dashboard_api.return_value = MagicMock()
+        logger: Logger = getLogger(name="test")
+        device_obj: MagicMock = MagicMock()
+        device_obj.get_config_context.return_value = get_json_fixture(
+            folder="config_context",
+            file_name="backup_meraki_context.json",
+        )
+
+        for _ in range(2):
+            NetmikoCiscoMeraki.controller_setup(
+                device_obj=device_obj,
+                logger=logger,
+                authenticated_obj=mock_dashboard_api.return_value,
+            )
+
+        device_obj.get_config_context.assert_called_once()
+
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
     def test_controller_setup_no_org_id(
         self,
@@ -202,6 +272,36 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         self.assertIn(member="organizationId", container=setup_dict)
         self.assertIsNone(setup_dict.get("networkId"))
 
+    def test_resolve_method_callable_cached(self) -> None:
+        """Test a resolved method is reused for the same dashboard client."""
+        logger: Logger = getLogger(name="test")
+        controller: MagicMock = MagicMock()
+        method_callable: MagicMock = controller.organizations.getOrganization
+        method_callable.return_value = {"name": "org"}
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "organizations.getOrganization",
+                "method": "GET",
+                "query": [],
+                "parameters": ["organizationId"],
+                "jmespath": {"name": "name"},
+            },
+        ]
+
+        for _ in range(2):
+            NetmikoCiscoMeraki.resolve_backup_endpoint(
+                authenticated_obj=controller,
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=endpoint_context,
+                feature_name="org_backup",
+                organizationId="1278859",
+                networkId="123",
+            )
+            controller.organizations = MagicMock()
+
+        self.assertEqual(method_callable.call_count, 2)
+
     @patch(f"{base_import_path}.cisco_meraki._send_call")
     @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
@@ -243,6 +343,199 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         # Assertions
         self.assertIsNotNone(obj=responses)
 
+    @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_meraki._send_call")
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_backup_endpoint_bulk(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+        mock_send_call,
+        mock_resolve_url,
+    ) -> None:
+        """Test a bulk endpoint is called once for the devices of an organization and filtered per device."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock()
+        mock_send_call.return_value = [
+            {"serial": "Q2AA-AAAA-AAAA", "name": "switch-a"},
+            {"serial": "Q2BB-BBBB-BBBB", "name": "switch-b"},
+        ]
+        logger: Logger = getLogger(name="test")
+
+        responses: list[Any] = [
+            NetmikoCiscoMeraki.resolve_backup_endpoint(
+                authenticated_obj=mock_dashboard_api.return_value,
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=self.bulk_endpoint_context,
+                feature_name="device_backup",
+                organizationId="1278859",
+                networkId="123",
+                serial=serial,
+            )
+            for serial in ("Q2AA-AAAA-AAAA", "Q2BB-BBBB-BBBB")
+        ]
+
+        mock_send_call.assert_called_once()
+        self.assertEqual(responses[0], {"name": ["switch-a"]})
+        self.assertEqual(responses[1], {"name": ["switch-b"]})
+
+    @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_meraki._send_call")
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_backup_endpoint_bulk_keyed_by_dashboard_and_org(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+        mock_send_call,
+        mock_resolve_url,
+    ) -> None:
+        """Test a bulk response is not shared with another dashboard or organization."""
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock()
+        mock_send_call.return_value = [{"serial": "Q2AA-AAAA-AAAA", "name": "switch-a"}]
+        other_dashboard: str = f"https://{uuid.uuid4().hex}.meraki.com"
+        devices: list[tuple[str, str]] = [
+            (self.controller_url, "1278859"),
+            (self.controller_url, "9876543"),
+            (other_dashboard, "1278859"),
+            (self.controller_url, "1278859"),
+        ]
+
+        for controller_url, organization_id in devices:
+            mock_resolve_url.return_value = controller_url
+            NetmikoCiscoMeraki.resolve_backup_endpoint(
+                authenticated_obj=mock_dashboard_api.return_value,
+                device_obj=MagicMock(),
+                logger=getLogger(name="test"),
+                endpoint_context=self.bulk_endpoint_context,
+                feature_name="device_backup",
+                organizationId=organization_id,
+                networkId="123",
+                serial="Q2AA-AAAA-AAAA",
+            )
+
+        self.assertEqual(mock_send_call.call_count, 3)
+
+    @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_meraki._send_call")
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_backup_endpoint_bulk_concurrent_devices_call_once(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+        mock_send_call,
+        mock_resolve_url,
+    ) -> None:
+        """Test devices asking for the same bulk call together wait for a single call."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock()
+        serials: list[str] = [f"Q2AA-AAAA-000{i}" for i in range(5)]
+
+        def slow_call(**_: Any) -> list[dict[str, str]]:
+            time.sleep(0.05)
+            return [{"serial": serial, "name": f"switch-{serial[-1]}"} for serial in serials]
+
+        mock_send_call.side_effect = slow_call
+
+        with ThreadPoolExecutor(max_workers=len(serials)) as executor:
+            futures: list[Future[Any]] = [
+                executor.submit(
+                    NetmikoCiscoMeraki.resolve_backup_endpoint,
+                    authenticated_obj=mock_dashboard_api.return_value,
+                    device_obj=MagicMock(),
+                    logger=getLogger(name="test"),
+                    endpoint_context=self.bulk_endpoint_context,
+                    feature_name="device_backup",
+                    organizationId="1278859",
+                    networkId="123",
+                    serial=serial,
+                )
+                for serial in serials
+            ]
+
+        mock_send_call.assert_called_once()
+        self.assertEqual([future.result() for future in futures], [{"name": [f"switch-{i}"]} for i in range(5)])
+
+    @patch(f"{base_import_path}.cisco_meraki.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_meraki._send_call")
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_backup_endpoint_bulk_failure_not_kept(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+        mock_send_call,
+        mock_resolve_url,
+    ) -> None:
+        """Test a failed bulk call is sent again by the next device."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock()
+        mock_send_call.side_effect = [None, [{"serial": "Q2AA-AAAA-AAAA", "name": "switch-a"}]]
+
+        responses: list[Any] = [
+            NetmikoCiscoMeraki.resolve_backup_endpoint(
+                authenticated_obj=mock_dashboard_api.return_value,
+                device_obj=MagicMock(),
+                logger=getLogger(name="test"),
+                endpoint_context=self.bulk_endpoint_context,
+                feature_name="device_backup",
+                organizationId="1278859",
+                networkId="123",
+                serial="Q2AA-AAAA-AAAA",
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(mock_send_call.call_count, 2)
+        self.assertEqual(responses, [{}, {"name": ["switch-a"]}])
+
+    @patch(f"{base_import_path}.cisco_meraki._send_call")
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_backup_endpoint_paginate(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+        mock_send_call,
+    ) -> None:
+        """Test a paginated endpoint asks the SDK for every page."""
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock()
+        mock_send_call.return_value = [{"name": "switch-a"}]
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "organizations.getOrganizationDevices",
+                "method": "GET",
+                "query": [],
+                "parameters": ["organizationId"],
+                "paginate": True,
+                "jmespath": {"name": "[].name"},
+            },
+        ]
+
+        NetmikoCiscoMeraki.resolve_backup_endpoint(
+            authenticated_obj=mock_dashboard_api.return_value,
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            feature_name="device_backup",
+            organizationId="1278859",
+            networkId="123",
+        )
+
+        self.assertEqual(
+            mock_send_call.call_args.kwargs["payload"],
+            {"organizationId": "1278859", "total_pages": "all"},
+        )
+
     @patch(f"{base_import_path}.cisco_meraki._send_call")
     @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
@@ -458,6 +751,32 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         self.assertEqual(responses, [])
         mock_resolve_method_callable.assert_called_once()
 
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    def test_resolve_remediation_endpoint_missing_param(self, mock_resolve_method_callable) -> None:
+        """Test a missing non optional parameter is logged instead of raising."""
+        mock_method: MagicMock = MagicMock(return_value={"result": "success"})
+        mock_resolve_method_callable.return_value = mock_method
+        payload: dict[str, Any] = {"name": "test"}
+
+        with self.assertLogs(logger="test", level="ERROR"):
+            responses: list[Any] = NetmikoCiscoMeraki.resolve_remediation_endpoint(
+                authenticated_obj=MagicMock(),
+                device_obj=MagicMock(),
+                logger=getLogger(name="test"),
+                endpoint_context=[
+                    {
+                        "endpoint": "networks.updateNetworkSettings",
+                        "parameters": {"non_optional": ["organizationId", "networkId"]},
+                    },
+                ],
+                payload=payload,
+                organizationId="1278859",
+            )
+
+        self.assertEqual(responses, [{"result": "success"}])
+        mock_method.assert_called_once_with(name="test", organizationId="1278859")
+        self.assertEqual(payload, {"name": "test"})
+
     @patch(f"{base_import_path}.cisco_meraki._send_remediation_call")
     @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
     @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
@@ -493,3 +812,77 @@ class TestCiscoMerakiDispatcher(unittest.TestCase):
         )
 
         mock_send_remediation_call.assert_called_once()
+
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_remediation_endpoint_payload_is_list(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+    ) -> None:
+        """Test resolve_remediation_endpoint keeps the payload order when the payload is a list."""
+        mock_dashboard_api.return_value = MagicMock()
+        mock_method = MagicMock(side_effect=lambda **payload: {"result": payload["name"]})
+        mock_resolve_method_callable.return_value = mock_method
+        logger: Logger = getLogger(name="test")
+
+        endpoint_context: dict[Any, Any] = get_json_fixture(
+            folder="config_context",
+            file_name="remediation_meraki_context.json",
+        )["ntp_remediation"]
+        payload: list[dict[str, Any]] = [{"name": f"ntc-test-{i}"} for i in range(10)]
+
+        device_obj: MagicMock = MagicMock()
+        responses = NetmikoCiscoMeraki.resolve_remediation_endpoint(
+            authenticated_obj=mock_dashboard_api.return_value,
+            device_obj=device_obj,
+            logger=logger,
+            endpoint_context=endpoint_context,
+            payload=payload,
+            organizationId="1278859",
+        )
+
+        self.assertEqual(responses, [{"result": f"ntc-test-{i}"} for i in range(10)])
+        self.assertEqual(mock_method.call_count, 10)
+        self.assertNotIn("organizationId", payload[0])
+
+    @patch(f"{base_import_path}.cisco_meraki._resolve_method_callable")
+    @patch(f"{base_import_path}.cisco_meraki.DashboardAPI")
+    def test_resolve_remediation_endpoint_parallel(
+        self,
+        mock_dashboard_api,
+        mock_resolve_method_callable,
+    ) -> None:
+        """Test a parallel endpoint sends its items from pool workers and keeps the payload order."""
+        senders: list[threading.Thread] = []
+
+        def send(**payload: Any) -> dict[str, Any]:
+            senders.append(threading.current_thread())
+            return {"result": payload["name"]}
+
+        mock_dashboard_api.return_value = MagicMock()
+        mock_resolve_method_callable.return_value = MagicMock(side_effect=send)
+        logger: Logger = getLogger(name="test")
+
+        endpoint_context: list[dict[Any, Any]] = [
+            {
+                **get_json_fixture(
+                    folder="config_context",
+                    file_name="remediation_meraki_context.json",
+                )["ntp_remediation"][0],
+                "parallel": True,
+            },
+        ]
+        payload: list[dict[str, Any]] = [{"name": f"ntc-test-{i}"} for i in range(10)]
+
+        responses = NetmikoCiscoMeraki.resolve_remediation_endpoint(
+            authenticated_obj=mock_dashboard_api.return_value,
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            payload=payload,
+            organizationId="1278859",
+        )
+
+        self.assertEqual(responses, [{"result": f"ntc-test-{i}"} for i in range(10)])
+        self.assertNotIn(threading.current_thread(), senders)
@@ -1,12 +1,41 @@
 """Unit tests for the Cisco vManage dispatcher."""
 
+import json
+import time
 import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger, getLogger
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from nautobot.core.utils.data import render_jinja2
+from requests import Session
+from requests import exceptions as req_exceptions
+
+from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import ApiConnection
 from netscaler_ext.plugins.tasks.dispatcher.cisco_vmanage import NetmikoCiscoVmanage
 from netscaler_ext.tests.fixtures import get_json_fixture
+from netscaler_ext.utils.helper import render_jinja_template
+
+
+def _api_response(payload: Any = None, status_code: int = 200, **attrs: Any) -> MagicMock:
+    """Build a stub requests Response.
+
+    Args:
+        payload (Any): JSON payload of the response.
+        status_code (int): HTTP status code.
+        **attrs (Any): Other response attributes, i.e. headers or text.
+
+    Returns:
+        MagicMock: Stub Response.
+    """
+    return MagicMock(
+        ok=status_code < 400,
+        status_code=status_code,
+        content=json.dumps(payload).encode(),
+        **attrs,
+    )
 
 
 class TestCiscoVmanageDispatcher(unittest.TestCase):
@@ -14,6 +43,10 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
 
     base_import_path: str = "netscaler_ext.plugins.tasks.dispatcher"
 
+    def setUp(self) -> None:
+        """Use a controller of its own per test, logins are cached by controller URL."""
+        self.controller_url: str = f"https://{uuid.uuid4().hex}.vmanage.com"
+
     @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
     @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
     @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_obj")
@@ -25,12 +58,13 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
     ) -> None:
         """Test the authentication process for the Cisco vManage dispatcher."""
         # Setup mocks
-        mock_resolve_url.return_value = "https://vmanage.com"
+        mock_resolve_url.return_value = self.controller_url
         mock_configure_session.return_value = MagicMock()
         mock_return_response_obj.return_value = MagicMock()
         mock_return_response_obj.return_value.headers = {
             "Set-Cookie": "JSESSIONID=mock_session_id",
         }
+        mock_return_response_obj.return_value.text = "mock_token\n"
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
         task: MagicMock = MagicMock()
@@ -38,7 +72,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         task.host.username = "mock_api_username"
 
         # Call authenticate
-        NetmikoCiscoVmanage.authenticate(
+        connection: ApiConnection = NetmikoCiscoVmanage.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -47,6 +81,246 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         # Assertions
         mock_resolve_url.assert_called_once()
         mock_configure_session.assert_called_once()
+        self.assertEqual(connection.url, self.controller_url)
+        self.assertEqual(connection.headers["Cookie"], "JSESSIONID=mock_session_id")
+        self.assertEqual(connection.headers["X-XSRF-TOKEN"], "mock_token")
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_obj")
+    def test_authenticate_reuses_cached_headers(
+        self,
+        mock_return_response_obj,
+        mock_configure_session,
+        mock_resolve_url,
+    ) -> None:
+        """Test a second authenticate against the same controller reuses the cookie."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_return_response_obj.return_value = MagicMock()
+        mock_return_response_obj.return_value.headers = {
+            "Set-Cookie": "JSESSIONID=mock_session_id",
+        }
+        mock_return_response_obj.return_value.text = "mock_token"
+        logger: Logger = getLogger(name="test")
+        obj: MagicMock = MagicMock()
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+        task.host.username = "mock_api_username"
+
+        first: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=obj, task=task)
+        second: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=obj, task=task)
+
+        self.assertEqual(mock_return_response_obj.call_count, 2)
+        self.assertEqual(second.headers, first.headers)
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_obj")
+    def test_authenticate_changed_password_logs_in_again(
+        self,
+        mock_return_response_obj,
+        mock_configure_session,
+        mock_resolve_url,
+    ) -> None:
+        """Test a changed password does not reuse the cookie of the previous one."""
+        mock_resolve_url.return_value = self.controller_url
+        mock_return_response_obj.return_value = MagicMock()
+        mock_return_response_obj.return_value.headers = {
+            "Set-Cookie": "JSESSIONID=mock_session_id",
+        }
+        mock_return_response_obj.return_value.text = "mock_token"
+        logger: Logger = getLogger(name="test")
+        obj: MagicMock = MagicMock()
+        task: MagicMock = MagicMock()
+        task.host.username = "mock_api_username"
+
+        task.host.password = "mock_api_key"
+        NetmikoCiscoVmanage.authenticate(logger=logger, obj=obj, task=task)
+        task.host.password = "mock_rotated_api_key"
+        NetmikoCiscoVmanage.authenticate(logger=logger, obj=obj, task=task)
+
+        self.assertEqual(mock_return_response_obj.call_count, 4)
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    def test_resolve_backup_endpoint_logs_in_again_on_401(self, mock_resolve_url) -> None:
+        """Test a backup call answered 401 logs in again and is sent once more with the new cookie."""
+        mock_resolve_url.return_value = self.controller_url
+        session: MagicMock = MagicMock(headers={})
+        session.request.side_effect = [
+            _api_response(headers={"Set-Cookie": "JSESSIONID=expired"}),
+            _api_response(text="expired_token"),
+            _api_response(status_code=401, text="Unauthorized"),
+            _api_response(headers={"Set-Cookie": "JSESSIONID=renewed"}),
+            _api_response(text="renewed_token"),
+            _api_response(payload={"data": [{"templateName": "ntp"}, {"templateName": "aaa"}]}),
+        ]
+        logger: Logger = getLogger(name="test")
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+        task.host.username = "mock_api_username"
+
+        with patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", return_value=session):
+            connection: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=MagicMock(), task=task)
+            responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+                authenticated_obj=connection,
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=[
+                    {
+                        "endpoint": "dataservice/template/feature",
+                        "method": "GET",
+                        "jmespath": {"templateName": "data[].templateName"},
+                    },
+                ],
+                feature_name="ntp_backup",
+            )
+
+        self.assertEqual(responses, [{"templateName": "ntp"}, {"templateName": "aaa"}])
+        self.assertEqual(session.request.call_count, 6)
+        self.assertEqual(connection.headers["X-XSRF-TOKEN"], "renewed_token")
+        self.assertEqual(session.headers["Cookie"], "JSESSIONID=renewed")
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    def test_resolve_backup_endpoint_second_401_not_retried(self, mock_resolve_url) -> None:
+        """Test a call answered 401 again after the new login is given up."""
+        mock_resolve_url.return_value = self.controller_url
+        session: MagicMock = MagicMock(headers={})
+        session.request.side_effect = [
+            _api_response(headers={"Set-Cookie": "JSESSIONID=expired"}),
+            _api_response(text="expired_token"),
+            _api_response(status_code=401, text="Unauthorized"),
+            _api_response(headers={"Set-Cookie": "JSESSIONID=renewed"}),
+            _api_response(text="renewed_token"),
+            _api_response(status_code=401, text="Unauthorized"),
+        ]
+        logger: Logger = getLogger(name="test")
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+        task.host.username = "mock_api_username"
+
+        with patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", return_value=session):
+            connection: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=MagicMock(), task=task)
+            with self.assertLogs(logger="test", level="ERROR"):
+                responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+                    authenticated_obj=connection,
+                    device_obj=MagicMock(),
+                    logger=logger,
+                    endpoint_context=[
+                        {
+                            "endpoint": "dataservice/template/feature",
+                            "method": "GET",
+                            "jmespath": {"templateName": "data[].templateName"},
+                        },
+                    ],
+                    feature_name="ntp_backup",
+                )
+
+        self.assertEqual(responses, {})
+        self.assertEqual(session.request.call_count, 6)
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    def test_resolve_backup_endpoint_post_not_resent_after_401(self, mock_resolve_url) -> None:
+        """Test a POST answered 401 logs in again but is not sent a second time."""
+        mock_resolve_url.return_value = self.controller_url
+        session: MagicMock = MagicMock(headers={})
+        session.request.side_effect = [
+            _api_response(headers={"Set-Cookie": "JSESSIONID=expired"}),
+            _api_response(text="expired_token"),
+            _api_response(status_code=401, text="Unauthorized"),
+            _api_response(headers={"Set-Cookie": "JSESSIONID=renewed"}),
+            _api_response(text="renewed_token"),
+        ]
+        logger: Logger = getLogger(name="test")
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+        task.host.username = "mock_api_username"
+
+        with patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", return_value=session):
+            connection: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=MagicMock(), task=task)
+            with self.assertLogs(logger="test", level="ERROR"):
+                responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+                    authenticated_obj=connection,
+                    device_obj=MagicMock(),
+                    logger=logger,
+                    endpoint_context=[
+                        {
+                            "endpoint": "dataservice/statistics/interface",
+                            "method": "POST",
+                            "jmespath": {"interface": "data[].interface"},
+                        },
+                    ],
+                    feature_name="interface_backup",
+                )
+
+        self.assertEqual(responses, {})
+        self.assertEqual(session.request.call_count, 5)
+        self.assertEqual(connection.headers["X-XSRF-TOKEN"], "renewed_token")
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    def test_authenticate_reused_session_drops_previous_device_auth(self, mock_resolve_url) -> None:
+        """Test a second device on the same thread logs in without the first device's cookie or token."""
+        mock_resolve_url.return_value = self.controller_url
+        sent: list[tuple[str, dict[str, str], dict[str, str]]] = []
+
+        def request(session: Session, **kwargs: Any) -> MagicMock:
+            sent.append((kwargs["url"], dict(session.headers), session.cookies.get_dict()))
+            if kwargs["url"].endswith("j_security_check"):
+                return _api_response(headers={"Set-Cookie": f"JSESSIONID={len(sent)}"})
+            return _api_response(text=f"token_{len(sent)}")
+
+        logger: Logger = getLogger(name="test")
+        first_task: MagicMock = MagicMock()
+        first_task.host.username = "first_user"
+        first_task.host.password = "first_password"
+        second_task: MagicMock = MagicMock()
+        second_task.host.username = "second_user"
+        second_task.host.password = "second_password"
+
+        with patch.object(target=Session, attribute="request", autospec=True, side_effect=request):
+            first: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=MagicMock(), task=first_task)
+            # What the first device's task leaves on the session.
+            first.session.headers.update(first.headers)
+            first.session.cookies.set("JSESSIONID", "first_device")
+            second: ApiConnection = NetmikoCiscoVmanage.authenticate(logger=logger, obj=MagicMock(), task=second_task)
+
+        self.assertIs(second.session, first.session)
+        self.assertEqual(len(sent), 4)
+        _, login_headers, login_cookies = sent[2]
+        self.assertNotIn("X-XSRF-TOKEN", login_headers)
+        self.assertNotIn("Cookie", login_headers)
+        self.assertEqual(login_cookies, {})
+        self.assertNotEqual(second.headers["X-XSRF-TOKEN"], first.headers["X-XSRF-TOKEN"])
+
+    @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
+    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_obj")
+    def test_authenticate_concurrent_hosts_login_once(
+        self,
+        mock_return_response_obj,
+        mock_configure_session,
+        mock_resolve_url,
+    ) -> None:
+        """Test hosts authenticating together against one controller share a single login."""
+        mock_resolve_url.return_value = self.controller_url
+        login_resp: MagicMock = MagicMock()
+        login_resp.headers = {"Set-Cookie": "JSESSIONID=mock_session_id"}
+        login_resp.text = "mock_token"
+
+        def slow_login(**_: Any) -> MagicMock:
+            time.sleep(0.05)
+            return login_resp
+
+        mock_return_response_obj.side_effect = slow_login
+        logger: Logger = getLogger(name="test")
+        task: MagicMock = MagicMock()
+        task.host.password = "mock_api_key"
+        task.host.username = "mock_api_username"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            for _ in range(5):
+                executor.submit(NetmikoCiscoVmanage.authenticate, logger=logger, obj=MagicMock(), task=task)
+
+        self.assertEqual(mock_return_response_obj.call_count, 2)
 
     @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
     @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
@@ -85,7 +359,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         mock_resolve_url,
     ) -> None:
         """Test authentication when security response is None."""
-        mock_resolve_url.return_value = "https://vmanage.com"
+        mock_resolve_url.return_value = self.controller_url
         mock_configure_session.return_value = MagicMock()
         mock_return_response_obj.return_value = None
         logger: Logger = getLogger(name="test")
@@ -114,7 +388,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         mock_resolve_url,
     ) -> None:
         """Test authentication when security response has no Set-Cookie header."""
-        mock_resolve_url.return_value = "https://vmanage.com"
+        mock_resolve_url.return_value = self.controller_url
         mock_configure_session.return_value = MagicMock()
         mock_return_response_obj.return_value = MagicMock()
         mock_return_response_obj.return_value.headers = {}
@@ -137,22 +411,20 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
     @patch(f"{base_import_path}.cisco_vmanage.resolve_controller_url")
     @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.configure_session")
     @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_obj")
-    @patch(f"{base_import_path}.cisco_vmanage.NetmikoCiscoVmanage.return_response_content")
     def test_authenticate_no_token_resp(
         self,
-        mock_return_response_content,
         mock_return_response_obj,
         mock_configure_session,
         mock_resolve_url,
     ) -> None:
         """Test authentication when token response is None."""
-        mock_resolve_url.return_value = "https://vmanage.com"
+        mock_resolve_url.return_value = self.controller_url
         mock_configure_session.return_value = MagicMock()
-        mock_return_response_obj.return_value = MagicMock()
-        mock_return_response_obj.return_value.headers = {
+        security_resp: MagicMock = MagicMock()
+        security_resp.headers = {
             "Set-Cookie": "JSESSIONID=mock_session_id",
         }
-        mock_return_response_content.return_value = None
+        mock_return_response_obj.side_effect = [security_resp, None]
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
         task: MagicMock = MagicMock()
@@ -167,20 +439,17 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
             )
         mock_resolve_url.assert_called_once()
         mock_configure_session.assert_called_once()
-        mock_return_response_obj.assert_called_once()
-        mock_return_response_content.assert_called_once()
+        self.assertEqual(mock_return_response_obj.call_count, 2)
 
-    @patch.object(target=NetmikoCiscoVmanage, attribute="url", new="https://vmanage.com")
-    @patch.object(target=NetmikoCiscoVmanage, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoVmanage, attribute="return_response_content")
-    def test_resolve_backup_endpoint(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint(self) -> None:
         """Test the get_config process for the Cisco vManage dispatcher."""
         # Setup mocks
-        mock_session.return_value = MagicMock()
-        mock_return_response_content.return_value = get_json_fixture(
-            folder="api_responses",
-            file_name="cisco_vmanage_backup.json",
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = _api_response(
+            payload=get_json_fixture(
+                folder="api_responses",
+                file_name="cisco_vmanage_backup.json",
+            ),
         )
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
@@ -192,7 +461,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoVmanage.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -205,14 +474,10 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         self.assertIn(member="templateName", container=responses)
         self.assertIn(member="templateId", container=responses)
 
-    @patch.object(target=NetmikoCiscoVmanage, attribute="url", new="https://vmanage.com")
-    @patch.object(target=NetmikoCiscoVmanage, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoVmanage, attribute="return_response_content")
-    def test_resolve_backup_endpoint_no_response(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint_no_response(self) -> None:
         """Test resolve_backup_endpoint when no response is returned."""
-        mock_session.return_value = MagicMock()
-        mock_return_response_content.return_value = None
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.side_effect = req_exceptions.ConnectionError("vManage unreachable")
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -222,7 +487,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoVmanage.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -232,14 +497,10 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
 
         self.assertEqual(responses, {})
 
-    @patch.object(target=NetmikoCiscoVmanage, attribute="url", new="https://vmanage.com")
-    @patch.object(target=NetmikoCiscoVmanage, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCiscoVmanage, attribute="configure_session", new=MagicMock())
-    @patch.object(target=NetmikoCiscoVmanage, attribute="return_response_content")
-    def test_resolve_backup_endpoint_jmespath_not_found(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint_jmespath_not_found(self) -> None:
         """Test resolve_backup_endpoint when jmespath values are not found."""
-        mock_session.return_value = MagicMock()
-        mock_return_response_content.return_value = {"some_key": "some_value"}
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = _api_response(payload={"some_key": "some_value"})
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -249,7 +510,7 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCiscoVmanage.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -258,3 +519,185 @@ class TestCiscoVmanageDispatcher(unittest.TestCase):
         )
 
         self.assertEqual(responses, {})
+
+    def test_resolve_backup_endpoint_keeps_endpoint_order(self) -> None:
+        """Test concurrent endpoint calls are merged in the config context order."""
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.side_effect = lambda **kwargs: _api_response(
+            payload={
+                "data": [{"templateName": f"{kwargs['url'].rsplit('/', 1)[-1]}-{i}"} for i in range(2)],
+            },
+        )
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": f"dataservice/template/feature{i}",
+                "method": "GET",
+                "jmespath": {"templateName": "data[].templateName"},
+            }
+            for i in range(5)
+        ]
+
+        responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            feature_name="ntp_backup",
+        )
+
+        self.assertEqual(mock_session.request.call_count, 5)
+        self.assertEqual(
+            [response["templateName"] for response in responses],
+            [f"feature{i}-{j}" for i in range(5) for j in range(2)],
+        )
+
+    @patch("netscaler_ext.utils.helper.engines")
+    def test_render_uri_template_compiled_once(self, mock_engines) -> None:
+        """Test URI templates are compiled once and reused across renders."""
+        template: str = f"dataservice/device/{{{{ obj.name }}}}?id={uuid.uuid4().hex}"
+        mock_engines["jinja"].env.from_string.return_value.render.return_value = "dataservice/device/vedge-1"
+        logger: Logger = getLogger(name="test")
+
+        for _ in range(2):
+            uri: str = render_jinja_template(obj=MagicMock(), logger=logger, template=template)
+
+        self.assertEqual(uri, "dataservice/device/vedge-1")
+        mock_engines["jinja"].env.from_string.assert_called_once_with(template)
+
+    def test_render_uri_template_matches_render_jinja2(self) -> None:
+        """Test the cached URI templates render like nautobot's render_jinja2."""
+        logger: Logger = getLogger(name="test")
+        device_obj: MagicMock = MagicMock()
+        device_obj.name = "vedge-1"
+        template: str = "dataservice/device/{{ obj.name | upper }}{% if obj.name %}/config{% endif %}"
+
+        self.assertEqual(
+            render_jinja_template(obj=device_obj, logger=logger, template=template),
+            render_jinja2(template_code=template, context={"obj": device_obj}),
+        )
+
+    def test_resolve_backup_endpoint_shares_identical_calls(self) -> None:
+        """Test endpoints only differing by jmespath are fetched once."""
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = _api_response(payload={"name": "vedge-1", "version": "20.9"})
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "dataservice/system/device",
+                "method": "GET",
+                "jmespath": {field: field},
+            }
+            for field in ("name", "version")
+        ]
+
+        responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            feature_name="system_backup",
+        )
+
+        mock_session.request.assert_called_once()
+        self.assertEqual(responses, {"name": "vedge-1", "version": "20.9"})
+
+    def test_resolve_backup_endpoint_merges_lists(self) -> None:
+        """Test list responses are merged in endpoint order."""
+        payloads: dict[str, dict[str, Any]] = {
+            "https://vmanage.com/dataservice/device/a": {
+                "data": [{"name": "a1", "device": "a"}, {"name": "a2", "device": "a"}],
+            },
+            "https://vmanage.com/dataservice/device/b": {
+                "data": [{"name": "b1", "device": "b"}, {"name": "b2", "device": "b"}],
+            },
+        }
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.side_effect = lambda **kwargs: _api_response(payload=payloads[kwargs["url"]])
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": f"dataservice/device/{device}",
+                "method": "GET",
+                "jmespath": {"name": "data[].name", "device": "data[].device"},
+            }
+            for device in ("a", "b")
+        ]
+
+        responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            feature_name="device_backup",
+        )
+
+        self.assertEqual(
+            responses,
+            [
+                {"name": "a1", "device": "a"},
+                {"name": "a2", "device": "a"},
+                {"name": "b1", "device": "b"},
+                {"name": "b2", "device": "b"},
+            ],
+        )
+
+    def test_resolve_backup_endpoint_mixed_types(self) -> None:
+        """Test a dict response after a list response raises a TypeError."""
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.return_value = _api_response(
+            payload={"data": [{"name": "a1", "id": 1}, {"name": "a2", "id": 2}], "version": "20.9"},
+        )
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {"endpoint": "dataservice/device", "method": "GET", "jmespath": {"name": "data[].name", "id": "data[].id"}},
+            {"endpoint": "dataservice/device", "method": "GET", "jmespath": {"version": "version"}},
+        ]
+
+        with self.assertRaises(TypeError):
+            NetmikoCiscoVmanage.resolve_backup_endpoint(
+                authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=endpoint_context,
+                feature_name="device_backup",
+            )
+
+    def test_resolve_backup_endpoint_paginated(self) -> None:
+        """Test paginated endpoints follow pageInfo and merge every page's data."""
+        mock_session: MagicMock = MagicMock(headers={})
+        mock_session.request.side_effect = [
+            _api_response(
+                payload={
+                    "data": [{"templateName": "a"}, {"templateName": "b"}],
+                    "pageInfo": {"endId": "2", "moreEntries": True},
+                },
+            ),
+            _api_response(payload={"data": [{"templateName": "c"}], "pageInfo": {"endId": "3", "moreEntries": False}}),
+        ]
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "dataservice/template/feature",
+                "method": "GET",
+                "paginate": 2,
+                "jmespath": {"templateName": "data[].templateName"},
+            },
+        ]
+
+        responses: Any = NetmikoCiscoVmanage.resolve_backup_endpoint(
+            authenticated_obj=ApiConnection(url="https://vmanage.com", session=mock_session),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            feature_name="ntp_backup",
+        )
+
+        self.assertEqual([response["templateName"] for response in responses], ["a", "b", "c"])
+        self.assertEqual(
+            [call.kwargs["url"] for call in mock_session.request.call_args_list],
+            [
+                "https://vmanage.com/dataservice/template/feature?count=2",
+                "https://vmanage.com/dataservice/template/feature?count=2&startId=2",
+            ],
+        )
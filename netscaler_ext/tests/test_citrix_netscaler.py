@@ -1,11 +1,15 @@
 """Unit tests for the Citrix Netscaler dispatcher."""
 
+import threading
 import unittest
 from logging import Logger, getLogger
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-from netscaler_ext.plugins.tasks.dispatcher.citrix_netscaler import NetmikoCitrixNetscaler
+from requests import Request
+
+from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import ApiConnection
+from netscaler_ext.plugins.tasks.dispatcher.citrix_netscaler import NetmikoCitrixNetscaler, use_snip_hostname
 from netscaler_ext.tests.fixtures import get_json_fixture
 
 
@@ -22,7 +26,6 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         mock_use_snip_hostname,
     ) -> None:
         """Test the authentication process for the Citrix Netscaler dispatcher."""
-        NetmikoCitrixNetscaler.get_headers = {}
         mock_use_snip_hostname.return_value = "https://netscaler.com"
         mock_configure_session.return_value = MagicMock()
         logger: Logger = getLogger(name="test")
@@ -31,7 +34,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         task.host.password = "mock_api_key"
         task.host.username = "mock_api_username"
 
-        NetmikoCitrixNetscaler.authenticate(
+        connection: ApiConnection = NetmikoCitrixNetscaler.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -39,8 +42,165 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
 
         mock_use_snip_hostname.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("X-NITRO-USER", NetmikoCitrixNetscaler.get_headers)
-        self.assertIn("X-NITRO-PASS", NetmikoCitrixNetscaler.get_headers)
+        self.assertIn("X-NITRO-USER", connection.headers)
+        self.assertIn("X-NITRO-PASS", connection.headers)
+
+    def test_use_snip_hostname(self) -> None:
+        """Test SNIP hostnames are derived from numbered device names only."""
+        self.assertEqual(use_snip_hostname(hostname="site_nsprod01"), "nsprodsnip.ipaper.com")
+        self.assertEqual(use_snip_hostname(hostname="netscaler.com"), "netscaler.com")
+
+    def test_configure_session_reused_per_host(self) -> None:
+        """Test the same thread gets one pooled session per host."""
+        session: Any = NetmikoCitrixNetscaler.configure_session(base_url="https://netscaler-a.com")
+
+        self.assertIs(
+            NetmikoCitrixNetscaler.configure_session(base_url="https://netscaler-a.com/nitro/v1"),
+            session,
+        )
+        self.assertIsNot(
+            NetmikoCitrixNetscaler.configure_session(base_url="https://netscaler-b.com"),
+            session,
+        )
+        self.assertEqual(
+            session.get_adapter(url="https://netscaler-a.com").poolmanager.connection_pool_kw["maxsize"],
+            32,
+        )
+
+    def test_configure_session_closed_with_thread(self) -> None:
+        """Test a worker thread's sessions are closed once the thread ends."""
+        sessions: list[Any] = []
+        worker: threading.Thread = threading.Thread(
+            target=lambda: sessions.append(
+                NetmikoCitrixNetscaler.configure_session(base_url="https://netscaler-closed.com"),
+            ),
+        )
+
+        with patch("requests.Session.close") as mock_close:
+            worker.start()
+            worker.join()
+
+        self.assertEqual(len(sessions), 1)
+        mock_close.assert_called_once()
+
+    def test_configure_session_shares_unverified_ssl_context(self) -> None:
+        """Test verify=False pools of every host reuse one SSL context and verified pools do not."""
+        pool_kwargs: list[dict[str, Any]] = []
+        hosts: list[tuple[str, bool]] = [
+            ("netscaler-ssl-a.com", False),
+            ("netscaler-ssl-b.com", False),
+            ("netscaler-ssl-a.com", True),
+        ]
+        for host, verify in hosts:
+            url: str = f"https://{host}/nitro/v1/config"
+            adapter: Any = NetmikoCitrixNetscaler.configure_session(base_url=url).get_adapter(url=url)
+            request: Any = Request(method="GET", url=url).prepare()
+            pool_kwargs.append(adapter.build_connection_pool_key_attributes(request=request, verify=verify)[1])
+
+        self.assertIsNotNone(pool_kwargs[0]["ssl_context"])
+        self.assertIs(pool_kwargs[0]["ssl_context"], pool_kwargs[1]["ssl_context"])
+        self.assertIsNot(pool_kwargs[2].get("ssl_context"), pool_kwargs[0]["ssl_context"])
+
+    def test_resolve_backup_endpoint_conditional(self) -> None:
+        """Test conditional endpoints send the kept ETag and reuse the kept payload on a 304."""
+        logger: Logger = getLogger(name="test")
+        session: MagicMock = MagicMock(headers={"X-NITRO-USER": "mock_api_username"})
+        session.request.side_effect = [
+            MagicMock(
+                status_code=200,
+                ok=True,
+                content=b'{"ntpserver": [{"servername": "ntp1"}, {"servername": "ntp2"}]}',
+                headers={"ETag": '"v1"'},
+            ),
+            MagicMock(status_code=304, ok=True, content=b"", headers={"ETag": '"v1"'}),
+        ]
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "nitro/v1/config/ntpserver",
+                "method": "GET",
+                "conditional": True,
+                "jmespath": {"ntp_server": "ntpserver[*].servername"},
+            },
+        ]
+
+        responses: list[Any] = [
+            NetmikoCitrixNetscaler.resolve_backup_endpoint(
+                authenticated_obj=ApiConnection(url="https://netscaler-etag.com", session=session),
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=endpoint_context,
+                feature_name="ntp_backup",
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(responses[0], [{"ntp_server": "ntp1"}, {"ntp_server": "ntp2"}])
+        self.assertEqual(responses[1], responses[0])
+        self.assertIsNone(session.request.call_args_list[0].kwargs["headers"])
+        self.assertEqual(session.request.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_resolve_backup_endpoint_conditional_per_credentials(self) -> None:
+        """Test a conditional endpoint called with other credentials does not reuse the kept ETag."""
+        logger: Logger = getLogger(name="test")
+        session: MagicMock = MagicMock(headers={"X-NITRO-USER": "first_user"})
+        session.request.return_value = MagicMock(
+            status_code=200,
+            ok=True,
+            content=b'{"ntpserver": [{"servername": "ntp1"}]}',
+            headers={"ETag": '"v1"'},
+        )
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "nitro/v1/config/ntpserver",
+                "method": "GET",
+                "conditional": True,
+                "jmespath": {"ntp_server": "ntpserver[*].servername"},
+            },
+        ]
+
+        for user in ("first_user", "second_user"):
+            session.headers = {"X-NITRO-USER": user}
+            NetmikoCitrixNetscaler.resolve_backup_endpoint(
+                authenticated_obj=ApiConnection(url="https://netscaler-etag-auth.com", session=session),
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=endpoint_context,
+                feature_name="ntp_backup",
+            )
+
+        self.assertIsNone(session.request.call_args_list[1].kwargs["headers"])
+
+    def test_resolve_backup_endpoint_not_conditional_by_default(self) -> None:
+        """Test endpoints without "conditional" never send If-None-Match."""
+        logger: Logger = getLogger(name="test")
+        session: MagicMock = MagicMock(headers={"X-NITRO-USER": "mock_api_username"})
+        session.request.return_value = MagicMock(
+            status_code=200,
+            ok=True,
+            content=b'{"ntpserver": [{"servername": "ntp1"}]}',
+            headers={"ETag": '"v1"'},
+        )
+        endpoint_context: list[dict[str, Any]] = [
+            {
+                "endpoint": "nitro/v1/config/ntpserver",
+                "method": "GET",
+                "jmespath": {"ntp_server": "ntpserver[*].servername"},
+            },
+        ]
+
+        for _ in range(2):
+            NetmikoCitrixNetscaler.resolve_backup_endpoint(
+                authenticated_obj=ApiConnection(url="https://netscaler-no-etag.com", session=session),
+                device_obj=MagicMock(),
+                logger=logger,
+                endpoint_context=endpoint_context,
+                feature_name="ntp_backup",
+            )
+
+        self.assertEqual(
+            [call.kwargs["headers"] for call in session.request.call_args_list],
+            [None, None],
+        )
 
     @patch(f"{base_import_path}.citrix_netscaler.use_snip_hostname")
     @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session")
@@ -50,7 +210,6 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         mock_use_snip_hostname,
     ) -> None:
         """Test authentication when use_snip_hostname returns an empty string."""
-        NetmikoCitrixNetscaler.get_headers = {}
         mock_use_snip_hostname.return_value = ""
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -58,7 +217,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         task.host.password = "mock_api_key"
         task.host.username = "mock_api_username"
 
-        NetmikoCitrixNetscaler.authenticate(
+        connection: ApiConnection = NetmikoCitrixNetscaler.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -66,8 +225,8 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
 
         mock_use_snip_hostname.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("X-NITRO-USER", NetmikoCitrixNetscaler.get_headers)
-        self.assertEqual(NetmikoCitrixNetscaler.get_headers["X-NITRO-USER"], "mock_api_username")
+        self.assertIn("X-NITRO-USER", connection.headers)
+        self.assertEqual(connection.headers["X-NITRO-USER"], "mock_api_username")
 
     @patch(f"{base_import_path}.citrix_netscaler.use_snip_hostname")
     @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session")
@@ -77,7 +236,6 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         mock_use_snip_hostname,
     ) -> None:
         """Test authentication when username is missing."""
-        NetmikoCitrixNetscaler.get_headers = {}
         mock_use_snip_hostname.return_value = "https://netscaler.com"
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -85,7 +243,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         task.host.password = "mock_api_key"
         task.host.username = ""
 
-        NetmikoCitrixNetscaler.authenticate(
+        connection: ApiConnection = NetmikoCitrixNetscaler.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -93,8 +251,8 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
 
         mock_use_snip_hostname.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("X-NITRO-USER", NetmikoCitrixNetscaler.get_headers)
-        self.assertEqual(NetmikoCitrixNetscaler.get_headers["X-NITRO-USER"], "")
+        self.assertIn("X-NITRO-USER", connection.headers)
+        self.assertEqual(connection.headers["X-NITRO-USER"], "")
 
     @patch(f"{base_import_path}.citrix_netscaler.use_snip_hostname")
     @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session")
@@ -104,7 +262,6 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         mock_use_snip_hostname,
     ) -> None:
         """Test authentication when password is missing."""
-        NetmikoCitrixNetscaler.get_headers = {}
         mock_use_snip_hostname.return_value = "https://netscaler.com"
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -112,7 +269,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         task.host.password = ""
         task.host.username = "mock_api_username"
 
-        NetmikoCitrixNetscaler.authenticate(
+        connection: ApiConnection = NetmikoCitrixNetscaler.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -120,17 +277,13 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
 
         mock_use_snip_hostname.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("X-NITRO-PASS", NetmikoCitrixNetscaler.get_headers)
-        self.assertEqual(NetmikoCitrixNetscaler.get_headers["X-NITRO-PASS"], "")
+        self.assertIn("X-NITRO-PASS", connection.headers)
+        self.assertEqual(connection.headers["X-NITRO-PASS"], "")
 
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="url", new="https://netscaler.com")
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session", new=MagicMock())
     @patch.object(target=NetmikoCitrixNetscaler, attribute="return_response_content")
-    def test_resolve_backup_endpoint(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint(self, mock_return_response_content) -> None:
         """Test the authentication process for the Citrix Netscaler dispatcher."""
         # Setup mocks
-        mock_session.return_value = MagicMock()
         mock_return_response_content.return_value = get_json_fixture(
             folder="api_responses",
             file_name="full_netscaler_response.json",
@@ -145,7 +298,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCitrixNetscaler.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://netscaler.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -161,13 +314,9 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         self.assertIsNotNone(obj=responses)
         self.assertEqual(responses, expected_response)
 
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="url", new="https://netscaler.com")
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session", new=MagicMock())
     @patch.object(target=NetmikoCitrixNetscaler, attribute="return_response_content")
-    def test_resolve_backup_endpoint_no_response(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint_no_response(self, mock_return_response_content) -> None:
         """Test resolve_backup_endpoint when no response is returned."""
-        mock_session.return_value = MagicMock()
         mock_return_response_content.return_value = None
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
@@ -178,7 +327,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCitrixNetscaler.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://netscaler.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -188,13 +337,9 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
 
         self.assertEqual(responses, {})
 
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="url", new="https://netscaler.com")
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="session", new_callable=MagicMock)
-    @patch.object(target=NetmikoCitrixNetscaler, attribute="configure_session", new=MagicMock())
     @patch.object(target=NetmikoCitrixNetscaler, attribute="return_response_content")
-    def test_resolve_backup_endpoint_jmespath_not_found(self, mock_return_response_content, mock_session) -> None:
+    def test_resolve_backup_endpoint_jmespath_not_found(self, mock_return_response_content) -> None:
         """Test resolve_backup_endpoint when jmespath values are not found."""
-        mock_session.return_value = MagicMock()
         mock_return_response_content.return_value = {"some_key": "some_value"}
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
@@ -205,7 +350,7 @@ class TestCitrixNetscalerDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoCitrixNetscaler.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://netscaler.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("ntp_backup"),
@@ -6,10 +6,7 @@ from collections import deque
 from typing import Any
 from unittest.mock import MagicMock
 
-from netscaler_ext.plugins.tasks.remediation.controller_remediation import (
-    DictKey,
-    JsonControllerRemediation,
-)
+from netscaler_ext.plugins.tasks.remediation.controller_remediation import JsonControllerRemediation
 
 
 def load_fixture(filename: str) -> Any:
@@ -49,7 +46,7 @@ class TestJsonControllerRemediation(unittest.TestCase):
 
     def test_process_diff_dictkey(self):
         diff = {}
-        path = (DictKey("foo"),)
+        path = (("d", "foo"),)
         value = "bar"
         remediation = JsonControllerRemediation(MagicMock())
         remediation._process_diff(diff, path, value)
@@ -78,6 +75,7 @@ class TestJsonControllerRemediation(unittest.TestCase):
         diff = {}
         stack = deque()
         remediation._dict_config(intended, actual, diff, tuple(), stack)
+        remediation._process_stack(diff, stack)
         self.assertEqual(diff["foo"]["bar"], 1)
 
     def test_list_config(self):
@@ -87,8 +85,20 @@ class TestJsonControllerRemediation(unittest.TestCase):
         diff = []
         stack = deque()
         remediation._list_config(intended, actual, diff, tuple(), stack)
+        remediation._process_stack(diff, stack)
         self.assertEqual(diff[0]["bar"], 1)
 
+    def test_process_stack_deep_config(self):
+        remediation = JsonControllerRemediation(MagicMock())
+        intended, actual = {"leaf": 1}, {"leaf": 2}
+        for _ in range(5000):
+            intended, actual = {"nested": intended}, {"nested": actual}
+        diff = {}
+        remediation._process_stack(diff, deque([(tuple(), actual, intended)]))
+        for _ in range(5000):
+            diff = diff["nested"]
+        self.assertEqual(diff, {"leaf": 1})
+
     def test_str_int_float_config(self):
         remediation = JsonControllerRemediation(MagicMock())
         diff = {}
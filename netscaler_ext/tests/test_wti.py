@@ -1,10 +1,12 @@
 """Unit tests for the WTI dispatcher."""
 
+import threading
 import unittest
 from logging import Logger, getLogger
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from netscaler_ext.plugins.tasks.dispatcher.api_base_dispatcher import ApiConnection
 from netscaler_ext.plugins.tasks.dispatcher.wti import NetmikoWti
 from netscaler_ext.tests.fixtures import get_json_fixture
 
@@ -22,7 +24,6 @@ class TestWtiDispatcher(unittest.TestCase):
         mock_base_64_encode_credentials,
     ) -> None:
         """Test the authentication process for the WTI dispatcher."""
-        NetmikoWti.get_headers = {}
         mock_base_64_encode_credentials.return_value = "mock_encoded_creds"
         mock_configure_session.return_value = MagicMock()
         logger: Logger = getLogger(name="test")
@@ -32,7 +33,7 @@ class TestWtiDispatcher(unittest.TestCase):
         task.host.password = "mock_api_key"
         task.host.username = "mock_api_username"
 
-        NetmikoWti.authenticate(
+        connection: ApiConnection = NetmikoWti.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -40,7 +41,7 @@ class TestWtiDispatcher(unittest.TestCase):
 
         mock_base_64_encode_credentials.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("Authorization", NetmikoWti.get_headers)
+        self.assertIn("Authorization", connection.headers)
 
     @patch(f"{base_import_path}.wti.base_64_encode_credentials")
     @patch.object(target=NetmikoWti, attribute="configure_session")
@@ -50,7 +51,6 @@ class TestWtiDispatcher(unittest.TestCase):
         mock_base_64_encode_credentials,
     ) -> None:
         """Test authentication when username is missing."""
-        NetmikoWti.get_headers = {}
         mock_base_64_encode_credentials.return_value = "mock_encoded_creds"
         mock_configure_session.return_value = MagicMock()
         logger: Logger = getLogger(name="test")
@@ -60,7 +60,7 @@ class TestWtiDispatcher(unittest.TestCase):
         task.host.password = "mock_api_key"
         task.host.username = ""
 
-        NetmikoWti.authenticate(
+        connection: ApiConnection = NetmikoWti.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -68,7 +68,7 @@ class TestWtiDispatcher(unittest.TestCase):
 
         mock_base_64_encode_credentials.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("Authorization", NetmikoWti.get_headers)
+        self.assertIn("Authorization", connection.headers)
 
     @patch(f"{base_import_path}.wti.base_64_encode_credentials")
     @patch.object(target=NetmikoWti, attribute="configure_session")
@@ -78,7 +78,6 @@ class TestWtiDispatcher(unittest.TestCase):
         mock_base_64_encode_credentials,
     ) -> None:
         """Test authentication when password is missing."""
-        NetmikoWti.get_headers = {}
         mock_base_64_encode_credentials.return_value = "mock_encoded_creds"
         mock_configure_session.return_value = MagicMock()
         logger: Logger = getLogger(name="test")
@@ -88,7 +87,7 @@ class TestWtiDispatcher(unittest.TestCase):
         task.host.password = ""
         task.host.username = "mock_api_username"
 
-        NetmikoWti.authenticate(
+        connection: ApiConnection = NetmikoWti.authenticate(
             logger=logger,
             obj=obj,
             task=task,
@@ -96,7 +95,7 @@ class TestWtiDispatcher(unittest.TestCase):
 
         mock_base_64_encode_credentials.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertIn("Authorization", NetmikoWti.get_headers)
+        self.assertIn("Authorization", connection.headers)
 
     @patch(f"{base_import_path}.wti.base_64_encode_credentials")
     @patch.object(target=NetmikoWti, attribute="configure_session")
@@ -106,7 +105,6 @@ class TestWtiDispatcher(unittest.TestCase):
         mock_base_64_encode_credentials,
     ) -> None:
         """Test authentication when base_64_encode_credentials raises ValueError."""
-        NetmikoWti.get_headers = {}
         mock_base_64_encode_credentials.side_effect = ValueError("Test Error")
         logger: Logger = getLogger(name="test")
         obj: MagicMock = MagicMock()
@@ -124,7 +122,6 @@ class TestWtiDispatcher(unittest.TestCase):
 
         mock_base_64_encode_credentials.assert_called_once()
         mock_configure_session.assert_called_once()
-        self.assertNotIn("Authorization", NetmikoWti.get_headers)
 
     @patch.object(target=NetmikoWti, attribute="return_response_content")
     def test_resolve_backup_endpoint(self, mock_return_response_content) -> None:
@@ -134,7 +131,6 @@ class TestWtiDispatcher(unittest.TestCase):
             folder="api_responses",
             file_name="wti_backup.json",
         )
-        NetmikoWti.session = MagicMock()
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -145,7 +141,7 @@ class TestWtiDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoWti.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://wti.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("snmp_backup"),
@@ -156,13 +152,10 @@ class TestWtiDispatcher(unittest.TestCase):
         # Assertions
         self.assertIsNotNone(obj=responses)
 
-    @patch.object(target=NetmikoWti, attribute="url", new="https://wti.com")
-    @patch.object(target=NetmikoWti, attribute="configure_session", new=MagicMock())
     @patch.object(target=NetmikoWti, attribute="return_response_content")
     def test_resolve_backup_endpoint_no_response(self, mock_return_response_content) -> None:
         """Test resolve_backup_endpoint when no response is returned."""
         mock_return_response_content.return_value = None
-        NetmikoWti.session = MagicMock()
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -172,7 +165,7 @@ class TestWtiDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoWti.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://wti.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("snmp_backup"),
@@ -182,13 +175,10 @@ class TestWtiDispatcher(unittest.TestCase):
 
         self.assertEqual(responses, {})
 
-    @patch.object(target=NetmikoWti, attribute="url", new="https://wti.com")
-    @patch.object(target=NetmikoWti, attribute="configure_session", new=MagicMock())
     @patch.object(target=NetmikoWti, attribute="return_response_content")
     def test_resolve_backup_endpoint_jmespath_not_found(self, mock_return_response_content) -> None:
         """Test resolve_backup_endpoint when jmespath values are not found."""
         mock_return_response_content.return_value = {"some_key": "some_value"}
-        NetmikoWti.session = MagicMock()
         logger: Logger = getLogger(name="test")
         config_context: dict[Any, Any] = get_json_fixture(
             folder="config_context",
@@ -198,7 +188,7 @@ class TestWtiDispatcher(unittest.TestCase):
         kwargs: dict[str, Any] = {}
         device_obj: MagicMock = MagicMock()
         responses: dict[str, str] = NetmikoWti.resolve_backup_endpoint(
-            authenticated_obj=None,
+            authenticated_obj=ApiConnection(url="https://wti.com", session=MagicMock()),
             device_obj=device_obj,
             logger=logger,
             endpoint_context=config_context.get("snmp_backup"),
@@ -207,3 +197,83 @@ class TestWtiDispatcher(unittest.TestCase):
         )
 
         self.assertEqual(responses, {})
+
+    @patch.object(target=NetmikoWti, attribute="return_response_content")
+    def test_resolve_remediation_endpoint_payload_is_list(self, mock_return_response_content) -> None:
+        """Test list payload items of a parallel endpoint are sent concurrently and returned in payload order."""
+        mock_return_response_content.side_effect = lambda **kwargs: {"sent": kwargs["body"]["name"]}
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [
+            {"endpoint": "api/v2/config/snmpaccess", "method": "PUT", "parallel": True},
+        ]
+        payload: list[dict[str, Any]] = [{"name": f"community{index}"} for index in range(12)]
+
+        responses: list[dict[str, Any]] = NetmikoWti.resolve_remediation_endpoint(
+            authenticated_obj=ApiConnection(url="https://wti.com", session=MagicMock()),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            payload=payload,
+        )
+
+        self.assertEqual(responses, [{"sent": f"community{index}"} for index in range(12)])
+        self.assertEqual(mock_return_response_content.call_count, 12)
+
+    @patch.object(target=NetmikoWti, attribute="return_response_content")
+    def test_resolve_remediation_endpoint_sequential_by_default(self, mock_return_response_content) -> None:
+        """Test list payload items are sent one at a time from the task thread unless the endpoint is parallel."""
+        senders: list[threading.Thread] = []
+
+        def send(**kwargs: Any) -> dict[str, Any]:
+            senders.append(threading.current_thread())
+            return {"sent": kwargs["body"]["name"]}
+
+        mock_return_response_content.side_effect = send
+        logger: Logger = getLogger(name="test")
+        endpoint_context: list[dict[str, Any]] = [{"endpoint": "api/v2/config/snmpaccess", "method": "PUT"}]
+        payload: list[dict[str, Any]] = [{"name": f"community{index}"} for index in range(3)]
+
+        responses: list[dict[str, Any]] = NetmikoWti.resolve_remediation_endpoint(
+            authenticated_obj=ApiConnection(url="https://wti.com", session=MagicMock()),
+            device_obj=MagicMock(),
+            logger=logger,
+            endpoint_context=endpoint_context,
+            payload=payload,
+        )
+
+        self.assertEqual(responses, [{"sent": f"community{index}"} for index in range(3)])
+        self.assertEqual(senders, [threading.current_thread()] * 3)
+
+    @patch(f"{base_import_path}.api_base_dispatcher.get_config_context")
+    @patch.object(target=NetmikoWti, attribute="return_response_content")
+    @patch.object(target=NetmikoWti, attribute="authenticate")
+    def test_merge_config_binds_auth_headers(
+        self,
+        mock_authenticate,
+        mock_return_response_content,
+        mock_get_config_context,
+    ) -> None:
+        """Test remediation calls go out with the device's auth headers bound to the session."""
+        session: MagicMock = MagicMock()
+        session.headers = {"User-Agent": "python-requests"}
+        mock_authenticate.return_value = ApiConnection(
+            url="https://wti.com",
+            session=session,
+            headers={"Authorization": "mock_encoded_creds"},
+        )
+        mock_return_response_content.side_effect = lambda **kwargs: dict(kwargs["session"].headers)
+        mock_get_config_context.return_value = {
+            "remediation_endpoints": ["snmp_remediation"],
+            "snmp_remediation": [{"endpoint": "api/v2/config/snmpaccess", "method": "PUT"}],
+        }
+
+        result: Any = NetmikoWti.merge_config(
+            task=MagicMock(),
+            logger=getLogger(name="test"),
+            obj=MagicMock(),
+            config={"snmp": {"name": "community"}},
+        )
+
+        sent_headers: dict[str, str] = result.result["result"][0][0]
+        self.assertEqual(sent_headers["Authorization"], "mock_encoded_creds")
+        self.assertEqual(sent_headers["User-Agent"], "python-requests")
@@ -2,47 +2,316 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Union
+import hashlib
+import json
+import ssl
+import threading
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from urllib.parse import urlsplit
 
 import requests
 from requests import exceptions as req_exceptions
 from requests.adapters import HTTPAdapter
+from requests.utils import default_headers
 from urllib3.util import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+try:
+    import orjson
+
+    # orjson parses the raw bytes directly, skipping the text decode step.
+    _json_loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
 
 if TYPE_CHECKING:
     from logging import Logger
 
+# Sized so a backup fan-out against one controller does not block on the pool.
+_POOL_CONNECTIONS: int = 16
+_POOL_MAXSIZE: int = 32
+_THREAD_SESSIONS: threading.local = threading.local()
+# Built once and shared by every unverified connection pool, urllib3 would
+# otherwise create a new SSLContext for each connection it opens.
+_UNVERIFIED_SSL_CONTEXT: ssl.SSLContext = create_urllib3_context(cert_reqs=ssl.CERT_NONE)
+# Bounds of the conditional GET cache, by entries and by the total size of the kept bodies.
+_ETAG_CACHE_MAXSIZE: int = 1024
+_ETAG_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+
+def _parse_cached_content(content: bytes, encoding: Optional[str]) -> Any:
+    """Parse a kept response body as JSON, falling back to its decoded text.
+
+    Args:
+        content (bytes): Raw response body.
+        encoding (str | None): Encoding the response declared.
+
+    Returns:
+        Any: API Response payload.
+    """
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError:
+        return content.decode(encoding or "utf-8", errors="replace")
+
+
+def _etag_cache_key(url: str, session: requests.Session, headers: Optional[dict[str, str]]) -> tuple[str, str]:
+    """Key a conditional GET by its URL and the credentials its headers carry.
+
+    Args:
+        url (str): URL of the request.
+        session (Session): Session sending the request.
+        headers (dict | None): Headers sent on top of the session headers.
+
+    Returns:
+        tuple[str, str]: URL and a digest of the request headers.
+    """
+    merged: dict[str, Any] = {**session.headers, **(headers or {})}
+    identity: list[tuple[str, str]] = sorted((str(key).lower(), str(value)) for key, value in merged.items())
+    return url, hashlib.sha256(repr(identity).encode()).hexdigest()
+
+
+class _ETagCache:
+    """Raw GET bodies with the ETag they were served with, replayed on a 304.
+
+    Bodies are kept as bytes and parsed again on every hit, callers never
+    share a payload object. The least recently used entries are dropped
+    once the entry count or the total body size goes over its bound.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries (int): Most entries kept.
+            max_bytes (int): Most body bytes kept over all entries.
+        """
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.entries: OrderedDict[tuple[str, str], tuple[str, bytes, Optional[str]]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> Optional[tuple[str, bytes, Optional[str]]]:
+        """Return the entry of a key, marking it as recently used.
+
+        Args:
+            key (tuple[str, str]): Cache key.
+
+        Returns:
+            tuple[str, bytes, str | None] | None: ETag, body and encoding, None if not kept.
+        """
+        with self.lock:
+            entry: Optional[tuple[str, bytes, Optional[str]]] = self.entries.get(key)
+            if entry:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple[str, str], etag: str, content: bytes, encoding: Optional[str]) -> None:
+        """Keep a body, bodies larger than the whole cache are not kept.
+
+        Args:
+            key (tuple[str, str]): Cache key.
+            etag (str): ETag the body was served with.
+            content (bytes): Raw response body.
+            encoding (str | None): Encoding the response declared.
+        """
+        with self.lock:
+            self._discard(key=key)
+            if len(content) > self.max_bytes:
+                return
+            self.entries[key] = (etag, content, encoding)
+            self.size += len(content)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, (_, evicted, _) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def pop(self, key: tuple[str, str]) -> None:
+        """Drop the entry of a key if kept.
+
+        Args:
+            key (tuple[str, str]): Cache key.
+        """
+        with self.lock:
+            self._discard(key=key)
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        """Drop the entry of a key, the lock must be held.
+
+        Args:
+            key (tuple[str, str]): Cache key.
+        """
+        entry: Optional[tuple[str, bytes, Optional[str]]] = self.entries.pop(key, None)
+        if entry:
+            self.size -= len(entry[1])
+
+
+_ETAG_CACHE: _ETagCache = _ETagCache(max_entries=_ETAG_CACHE_MAXSIZE, max_bytes=_ETAG_CACHE_MAX_BYTES)
+
+
+class _ThreadSessions:  # pylint: disable=too-few-public-methods
+    """Holder of one thread's sessions by host, they are closed when the thread ends."""
+
+    def __init__(self) -> None:
+        """Create the session map and close its sessions once the holder is dropped."""
+        self.sessions: dict[str, requests.Session] = {}
+        # threading.local drops the holder when its thread ends, Nornir's worker threads end with the job run.
+        weakref.finalize(self, _close_sessions, self.sessions)
+
+
+def _close_sessions(sessions: dict[str, requests.Session]) -> None:
+    """Close the sessions of a finished thread, releasing their pooled connections.
+
+    Args:
+        sessions (dict[str, Session]): Sessions by host.
+    """
+    for session in sessions.values():
+        session.close()
+    sessions.clear()
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter reusing a single SSL context for verify=False requests."""
+
+    def build_connection_pool_key_attributes(
+        self,
+        request: requests.PreparedRequest,
+        verify: Union[bool, str],
+        cert: Optional[Union[str, tuple[str, str]]] = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Build the pool key attributes, pinning the shared unverified SSL context.
+
+        Args:
+            request (PreparedRequest): Request about to be sent.
+            verify (bool | str): Verify SSL certificate or CA bundle path.
+            cert (str | tuple[str, str] | None): Client certificate.
+
+        Returns:
+            tuple[dict[str, Any], dict[str, Any]]: Host parameters and pool kwargs.
+        """
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request=request,
+            verify=verify,
+            cert=cert,
+        )
+        if verify is False and host_params["scheme"] == "https":
+            pool_kwargs["ssl_context"] = _UNVERIFIED_SSL_CONTEXT
+        return host_params, pool_kwargs
+
 
 class ConnectionMixin:
     """Mixin to connect to a service."""
 
     @classmethod
-    def configure_session(cls) -> requests.Session:
-        """Configure a requests session.
+    def configure_session(cls, base_url: str = "") -> requests.Session:
+        """Configure a requests session, reusing the calling thread's one for the host.
+
+        Nornir runs every host in a worker thread, so keeping one session per
+        thread and host lets consecutive devices behind the same controller
+        reuse its keep-alive connections. A reused session gets its default
+        headers back and its cookies cleared, the previous device's auth never
+        reaches the next device's login. The session is also used by the
+        workers a task fans its API calls out to: they only send requests and
+        the urllib3 connection pools are thread-safe. The sessions are closed
+        when their thread ends, at the end of the Nornir run.
+
+        Args:
+            base_url (str): Base URL of the host the session will talk to.
 
         Returns:
             Session: Requests session.
         """
-        session: requests.Session = requests.Session()
+        host: str = urlsplit(base_url).netloc
+        thread_sessions: Optional[_ThreadSessions] = getattr(_THREAD_SESSIONS, "holder", None)
+        if thread_sessions is None:
+            thread_sessions = _THREAD_SESSIONS.holder = _ThreadSessions()
+        sessions: dict[str, requests.Session] = thread_sessions.sessions
+        session: Optional[requests.Session] = sessions.get(host)
+        if session is not None:
+            session.headers = default_headers()
+            session.cookies.clear()
+            return session
+        session = requests.Session()
         retries = Retry(
             total=2,
             backoff_factor=0.5,
             backoff_max=5.0,
-            status_forcelist=[502, 503, 504],
+            # urllib3 waits for the Retry-After of a 429 or 503 before retrying.
+            status_forcelist=[429, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        session.mount(
-            prefix="https://",
-            adapter=HTTPAdapter(max_retries=retries),
+        adapter = _PooledHTTPAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=retries,
         )
+        session.mount(prefix="https://", adapter=adapter)
+        session.mount(prefix="http://", adapter=adapter)
+        sessions[host] = session
         return session
 
+    @classmethod
+    def _parse_response_content(cls, response: requests.Response) -> Any:
+        """Parse a response payload as JSON, falling back to its text.
+
+        Args:
+            response (Response): API Response object.
+
+        Returns:
+            Any: API Response payload.
+        """
+        try:
+            return _json_loads(response.content)
+        except json.JSONDecodeError:
+            return response.text
+
+    @classmethod
+    def _send_request(
+        cls,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]],
+        session: requests.Session,
+        logger: Logger,
+        body: Optional[Union[dict[str, str], str]] = None,
+        verify: bool = True,
+    ) -> Optional[requests.Response]:
+        """Send a request and return its response whatever the status code.
+
+        Args:
+            method (str): HTTP Method to use.
+            url (str): URL to send request to.
+            headers (dict | None): Headers to use in request, on top of the session headers.
+            session (Session): Session to use.
+            logger (Logger): The dispatcher's logger.
+            body (dict[str, str] | str | None): Body of request.
+            verify (bool): Verify SSL certificate.
+
+        Returns:
+            Optional[Response]: API Response object, None if the request could not be sent.
+        """
+        try:
+            return session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=body,
+                timeout=(50.0, 100.0),
+                verify=verify,
+            )
+        except req_exceptions.RequestException as exc_req:
+            # The exception name tells SSLError, Timeout and ConnectionError apart.
+            logger.error("%s calling %s: %s", type(exc_req).__name__, url, exc_req)
+            return None
+
     @classmethod
     def _return_response(
         cls,
         method: str,
         url: str,
-        headers: dict[str, str],
+        headers: Optional[dict[str, str]],
         session: requests.Session,
         logger: Logger,
         body: Optional[Union[dict[str, str], str]] = None,
@@ -53,7 +322,7 @@ class ConnectionMixin:
         Args:
             method (str): HTTP Method to use.
             url (str): URL to send request to.
-            headers (dict): Headers to use in request.
+            headers (dict | None): Headers to use in request, on top of the session headers.
             session (Session): Session to use.
             logger (Logger): The dispatcher's logger.
             body (dict[str, str] | str | None): Body of request.
@@ -62,36 +331,15 @@ class ConnectionMixin:
         Returns:
             Optional[Response]: API Response object.
         """
-        with session as ses:
-            try:
-                response: Optional[requests.Response] = ses.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    data=body,
-                    timeout=(50.0, 100.0),
-                    verify=verify,
-                )
-            except req_exceptions.SSLError as exc_ssl:
-                exc_msg: str = f"SSL error occurred: {exc_ssl}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.Timeout as exc_timeout:
-                exc_msg: str = f"Request timed out: {exc_timeout}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.ConnectionError as exc_conn:
-                exc_msg: str = f"Connection error occurred: {exc_conn}"
-                logger.error(exc_msg)
-                response = None
-            except req_exceptions.RequestException as exc_req:
-                exc_msg: str = f"Request exception occurred: {exc_req}"
-                logger.error(exc_msg)
-                response = None
-            except Exception as exc:
-                exc_msg: str = f"An error occurred: {exc}"
-                logger.error(exc_msg)
-                response = None
+        response: Optional[requests.Response] = cls._send_request(
+            method=method,
+            url=url,
+            headers=headers,
+            session=session,
+            logger=logger,
+            body=body,
+            verify=verify,
+        )
         if response is None:
             return response
         if not response.ok:
@@ -106,7 +354,7 @@ class ConnectionMixin:
         cls,
         method: str,
         url: str,
-        headers: dict[str, str],
+        headers: Optional[dict[str, str]],
         session: requests.Session,
         logger: Logger,
         body: dict[str, str] | str | None = None,
@@ -117,7 +365,7 @@ class ConnectionMixin:
         Args:
             method (str): HTTP Method to use.
             url (str): URL to send request to.
-            headers (dict): Headers to use in request.
+            headers (dict | None): Headers to use in request, on top of the session headers.
             session (Session): Session to use.
             logger (Logger): The dispatcher's logger.
             body (dict[str, str] | str | None): Body of request.
@@ -141,29 +389,43 @@ class ConnectionMixin:
         cls,
         method: str,
         url: str,
-        headers: dict[str, str],
+        headers: Optional[dict[str, str]],
         session: requests.Session,
         logger: Logger,
         body: dict[str, str] | str | None = None,
         verify: bool = True,
+        conditional: bool = False,
     ) -> Any:
         """Create request and return response payload.
 
+        With conditional set, the body of a GET response carrying an ETag is
+        kept and the next GET to the same URL with the same credentials sends
+        it as If-None-Match. When the endpoint answers 304 Not Modified the
+        kept body is parsed again and returned without a body transfer.
+
         Args:
             method (str): HTTP Method to use.
             url (str): URL to send request to.
-            headers (dict): Headers to use in request.
+            headers (dict | None): Headers to use in request, on top of the session headers.
             session (Session): Session to use.
             logger (Logger): The dispatcher's logger.
             body (dict[str, str] | str | None): Body of request.
             verify (bool): Verify SSL certificate.
+            conditional (bool): Send GET requests as conditional requests.
 
         Returns:
             Any: API Response.
         """
-        response: Optional[requests.Response] = None
+        conditional = conditional and method.upper() == "GET"
+        cache_key: Optional[tuple[str, str]] = None
+        cached: Optional[tuple[str, bytes, Optional[str]]] = None
+        if conditional:
+            cache_key = _etag_cache_key(url=url, session=session, headers=headers)
+            cached = _ETAG_CACHE.get(key=cache_key)
+            if cached:
+                headers = {**(headers or {}), "If-None-Match": cached[0]}
         try:
-            response = cls._return_response(
+            response: Optional[requests.Response] = cls._return_response(
                 method=method,
                 url=url,
                 headers=headers,
@@ -172,13 +434,19 @@ class ConnectionMixin:
                 body=body,
                 verify=verify,
             )
-            if not response:
-                return response
-            return response.json()
-        except req_exceptions.JSONDecodeError:
-            if not response:
-                return response
-            return response.text
         except req_exceptions.HTTPError as http_err:
             logger.error(http_err)
             return None
+        if not response:
+            return response
+        if cached and response.status_code == 304:
+            logger.debug("%s not modified, reusing the cached payload.", url)
+            return _parse_cached_content(content=cached[1], encoding=cached[2])
+        content: Any = cls._parse_response_content(response=response)
+        if cache_key:
+            etag: Optional[str] = response.headers.get("ETag")
+            if etag:
+                _ETAG_CACHE.put(key=cache_key, etag=etag, content=response.content, encoding=response.encoding)
+            else:
+                _ETAG_CACHE.pop(key=cache_key)
+        return content
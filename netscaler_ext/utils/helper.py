@@ -2,24 +2,68 @@
 
 from __future__ import annotations
 
+import threading
 from base64 import b64encode
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, OrderedDict
 
 # import jdiff
 import jmespath
+import textfsm
+from django.template import engines
 from jinja2 import exceptions as jinja_errors
 from nautobot.apps.choices import (
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
-from nautobot.core.utils.data import render_jinja2
 from nautobot.extras.models import SecretsGroup, SecretsGroupAssociation
 
 if TYPE_CHECKING:
     from logging import Logger
+    from pathlib import Path
 
+    from jinja2 import Template
+    from jmespath.parser import ParsedResult
     from nautobot.dcim.models import Controller, Device
 
+# Attribute the rendered config context is stored under on the Device instance.
+_CONFIG_CONTEXT_ATTR: str = "_netscaler_ext_config_context"
+# TextFSM objects keep parser state, so each Nornir worker thread gets its own.
+_TEXTFSM_LOCAL: threading.local = threading.local()
+
+
+def get_config_context(obj: Device) -> OrderedDict[Any, Any]:
+    """Get the device config context, rendering it once per Device instance.
+
+    ``Device.get_config_context()`` queries and merges every applicable config
+    context on each call. The Device instance lives for the whole Nornir task,
+    so the result is kept on it and shared by every step that needs it.
+
+    Args:
+        obj (Device): The Device object from Nautobot.
+
+    Returns:
+        OrderedDict[Any, Any]: The rendered config context.
+    """
+    config_context: OrderedDict[Any, Any] | None = vars(obj).get(_CONFIG_CONTEXT_ATTR)
+    if config_context is None:
+        config_context = obj.get_config_context()
+        vars(obj)[_CONFIG_CONTEXT_ATTR] = config_context
+    return config_context
+
+
+@lru_cache(maxsize=256)
+def _compile_jinja_template(template: str) -> Template:
+    """Compile a Jinja template once with Nautobot's Jinja environment, it is reused across devices.
+
+    Args:
+        template (str): A Jinja2 template.
+
+    Returns:
+        Template: Compiled Jinja2 template.
+    """
+    return engines["jinja"].env.from_string(template)
+
 
 def render_jinja_template(obj: Device, logger: Logger, template: str) -> str:
     """Helper function to render Jinja templates.
@@ -36,7 +80,8 @@ def render_jinja_template(obj: Device, logger: Logger, template: str) -> str:
         ValueError: When there is an error rendering the ``template``.
     """
     try:
-        return render_jinja2(template_code=template, context={"obj": obj})
+        # Same environment and context as nautobot's render_jinja2, without compiling on every call.
+        return _compile_jinja_template(template=template).render(obj=obj)
     except jinja_errors.UndefinedError as error:
         error_msg = (
             "`E3019:` Jinja encountered and UndefinedError`, check the template "
@@ -178,10 +223,13 @@ def resolve_controller_url(
     if controller_group := obj.controller_managed_device_group:
         controller: Controller = controller_group.controller
         controller_url = controller.external_integration.remote_url
-    elif controllers := obj.controllers.all():
-        for cntrlr in controllers:
-            if controller_type in cntrlr.platform.name.lower():
-                controller_url = cntrlr.external_integration.remote_url
+    # Match the platform in the database and join the integration, one query per device.
+    elif cntrlr := (
+        obj.controllers.select_related("external_integration")
+        .filter(platform__name__icontains=controller_type)
+        .last()
+    ):
+        controller_url = cntrlr.external_integration.remote_url
     if not controller_url:
         exc_msg: str = "Could not find the Controller API URL"
         logger.error(exc_msg)
@@ -205,15 +253,30 @@ def resolve_params(
     params: dict[Any, Any] = {}
     if not parameters or not param_mapper:
         return params
+    # Index the mapper by lowercase key once, each parameter is then a single lookup.
+    mapper_index: dict[str, tuple[str, str]] = {k.lower(): (k, v) for k, v in param_mapper.items()}
     for param in parameters:
-        if param.lower() not in [p.lower() for p in param_mapper]:
+        match: tuple[str, str] | None = mapper_index.get(param.lower())
+        if match is None:
             continue
-        for k, v in param_mapper.items():
-            if k.lower() == param.lower():
-                params.update({k: v})
+        key, value = match
+        params[key] = value
     return params
 
 
+@lru_cache(maxsize=256)
+def _compile_jmespath(expression: str) -> ParsedResult:
+    """Compile a jmespath expression once, it is reused across devices.
+
+    Args:
+        expression (str): Jmespath expression.
+
+    Returns:
+        ParsedResult: Compiled jmespath expression.
+    """
+    return jmespath.compile(expression=expression)
+
+
 def resolve_jmespath(
     jmespath_values: dict[str, str],
     api_response: Any,
@@ -232,9 +295,8 @@ def resolve_jmespath(
     data_fields: dict[str, Any] = {}
 
     for key, value in jmespath_values.items():
-        j_value: Any = jmespath.search(
-            expression=value,
-            data=api_response,
+        j_value: Any = _compile_jmespath(expression=value).search(
+            value=api_response,
         )
         if j_value:
             data_fields.update({key: j_value})
@@ -328,9 +390,51 @@ def resolve_query(api_endpoint: str, query: list[str]) -> str:
     """
     if api_endpoint.endswith("/"):
         api_endpoint = api_endpoint[:-1]
-    api_endpoint = f"{api_endpoint}?{query.pop(0)}"
+    # Join rather than pop, the query list belongs to the device config context.
+    return f"{api_endpoint}?{'&'.join(query)}"
+
+
+def build_endpoint_url(base_url: str, endpoint: str, query: list[str] | None = None) -> str:
+    """Build the full API endpoint URL, query included, in a single pass.
+
+    Args:
+        base_url (str): Base url to format.
+        endpoint (str): Endpoint to format with.
+        query (list[str] | None): Query list to append, if any.
+
+    Returns:
+        str: API endpoint URL.
+
+    Raises:
+        ValueError: If base_url or endpoint is not passed.
+    """
+    if not base_url or not endpoint:
+        exc_msg: str = "Base or endpoint not passed, can not properly format url."
+        raise ValueError(exc_msg)
+    base_url = base_url[:-1] if base_url.endswith("/") else base_url
+    endpoint = endpoint[1:] if endpoint.startswith("/") else endpoint
     if not query:
-        return api_endpoint
-    for q in query:
-        api_endpoint = f"{api_endpoint}&{q}"
-    return api_endpoint
+        return f"{base_url}/{endpoint}"
+    endpoint = endpoint[:-1] if endpoint.endswith("/") else endpoint
+    return f"{base_url}/{endpoint}?{'&'.join(query)}"
+
+
+def parse_textfsm(template_path: Path, text: str) -> tuple[list[str], list[list[str]]]:
+    """Parse text with a TextFSM template, compiling the template once per thread.
+
+    Args:
+        template_path (Path): TextFSM template file.
+        text (str): Command output to parse.
+
+    Returns:
+        tuple[list[str], list[list[str]]]: Template header and parsed rows.
+    """
+    fsms: dict[Path, textfsm.TextFSM] = _TEXTFSM_LOCAL.__dict__.setdefault("fsms", {})
+    fsm: textfsm.TextFSM | None = fsms.get(template_path)
+    if fsm is None:
+        with open(file=template_path, encoding="utf-8") as template_file:
+            fsm = textfsm.TextFSM(template=template_file)
+        fsms[template_path] = fsm
+    # ParseText keeps appending to the rows of earlier parses, start from a clean FSM and hand out a copy.
+    fsm.Reset()
+    return fsm.header, list(fsm.ParseText(text=text))